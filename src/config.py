@@ -2,6 +2,7 @@ import os
 from pathlib import Path
 import yaml
 from datetime import datetime, timedelta
+from typing import Optional
 import pytz
 
 class Config:
@@ -112,6 +113,11 @@ class Config:
     def heatmap_emergency_file(self) -> str:
         return self._get_nested('visualization', 'heatmap', 'emergency_filename')
 
+    @property
+    def heatmap_tile_dir(self) -> Optional[Path]:
+        tile_dir = self._get_nested('visualization', 'heatmap', 'tile_cache_dir')
+        return Path(tile_dir) if tile_dir else None
+
     @property
     def heatmap_style(self) -> dict:
         return self._get_nested('visualization', 'heatmap', 'style')
@@ -116,70 +116,90 @@ class DataFetcher:
         
         return df
     
-    def fetch_full_dataset(self):
-        """Fetch the complete dataset from CSV endpoint (used in full refresh)."""
-        logger.info("Fetching full dataset from CSV endpoint")
+    def _read_local_dataset(self, path):
+        """Read a dataset snapshot from disk, choosing the reader by file extension.
         
-        try:
-            csv_url = config.initial_csv_path
-            logger.info(f"Downloading CSV from {csv_url}")
+        Parquet keeps its stored dtypes and skips text parsing; anything else is
+        read as CSV with every column as a string, like the downloaded CSV.
+        """
+        logger.info(f"Reading dataset from {path}")
+        if path.suffix == '.parquet':
+            return pd.read_parquet(path)
+        return pd.read_csv(path, dtype=str)
+    
+    def _download_csv(self, csv_url):
+        """Download the full dataset CSV, retrying dropped connections."""
+        logger.info(f"Downloading CSV from {csv_url}")
             
-            # Download with requests using streaming and show progress
-            session = requests.Session()
-            retry_count = 0
-            response = None
+        # Download with requests using streaming and show progress
+        session = requests.Session()
+        retry_count = 0
+        response = None
             
-            while retry_count < self.max_retries:
-                try:
-                    response = session.get(csv_url, stream=True, timeout=300)
-                    response.raise_for_status()
-                    break
-                except (requests.ConnectionError, requests.Timeout) as e:
-                    retry_count += 1
-                    if retry_count == self.max_retries:
-                        raise
-                    logger.warning(f"Download attempt {retry_count} failed: {str(e)}. Retrying in {self.retry_delay} seconds...")
-                    time.sleep(self.retry_delay)
+        while retry_count < self.max_retries:
+            try:
+                response = session.get(csv_url, stream=True, timeout=300)
+                response.raise_for_status()
+                break
+            except (requests.ConnectionError, requests.Timeout) as e:
+                retry_count += 1
+                if retry_count == self.max_retries:
+                    raise
+                logger.warning(f"Download attempt {retry_count} failed: {str(e)}. Retrying in {self.retry_delay} seconds...")
+                time.sleep(self.retry_delay)
             
-            if not response:
-                raise Exception("Failed to establish connection after retries")
+        if not response:
+            raise Exception("Failed to establish connection after retries")
                 
-            with response:
-                # Get total file size
-                total_size = int(response.headers.get('content-length', 0))
+        with response:
+            # Get total file size
+            total_size = int(response.headers.get('content-length', 0))
                 
-                # Save to temporary file first
-                temp_csv = self.data_dir / 'temp_full_dataset.csv'
-                with open(temp_csv, 'wb') as f:
-                    if total_size == 0:
-                        logger.warning("Content length header missing, progress bar will be disabled")
+            # Save to temporary file first
+            temp_csv = self.data_dir / 'temp_full_dataset.csv'
+            with open(temp_csv, 'wb') as f:
+                if total_size == 0:
+                    logger.warning("Content length header missing, progress bar will be disabled")
                     
-                    block_size = 8192
-                    downloaded = 0
+                block_size = 8192
+                downloaded = 0
                     
-                    for chunk in response.iter_content(chunk_size=block_size):
-                        f.write(chunk)
-                        downloaded += len(chunk)
+                for chunk in response.iter_content(chunk_size=block_size):
+                    f.write(chunk)
+                    downloaded += len(chunk)
                         
-                        if total_size > 0:
-                            # Calculate progress percentage
-                            progress = int(50 * downloaded / total_size)
-                            sys.stdout.write(
-                                f"\rDownloading: [{'=' * progress}{' ' * (50-progress)}] "
-                                f"{downloaded}/{total_size} bytes ({(downloaded/total_size)*100:.1f}%)"
-                            )
-                            sys.stdout.flush()
+                    if total_size > 0:
+                        # Calculate progress percentage
+                        progress = int(50 * downloaded / total_size)
+                        sys.stdout.write(
+                            f"\rDownloading: [{'=' * progress}{' ' * (50-progress)}] "
+                            f"{downloaded}/{total_size} bytes ({(downloaded/total_size)*100:.1f}%)"
+                        )
+                        sys.stdout.flush()
                 
-                if total_size > 0:
-                    sys.stdout.write('\n')
-                    sys.stdout.flush()
+            if total_size > 0:
+                sys.stdout.write('\n')
+                sys.stdout.flush()
                 
-                # Read from temporary file
-                logger.info("Reading CSV file...")
-                df = pd.read_csv(temp_csv, dtype=str)
+            # Read from temporary file
+            logger.info("Reading CSV file...")
+            df = pd.read_csv(temp_csv, dtype=str)
                 
-                # Clean up
-                temp_csv.unlink()
+            # Clean up
+            temp_csv.unlink()
+        
+        return df
+    
+    def fetch_full_dataset(self):
+        """Fetch the complete dataset from the CSV endpoint or a local CSV/Parquet file (used in full refresh)."""
+        logger.info("Fetching full dataset from CSV endpoint")
+        
+        try:
+            source = config.initial_csv_path
+            if source.startswith(('http://', 'https://')):
+                df = self._download_csv(source)
+            else:
+                df = self._read_local_dataset(Path(source))
             
             # Update last fetch time
             self._update_last_fetch()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Script to pre-download the basemap tiles used by the heatmap screenshots."""
+import math
+from pathlib import Path
+
+import requests
+
+from src.utils.logging import setup_logging, get_logger
+from src.config import config
+from src.visualization.charts import TILE_CACHE_MARKER
+
+logger = get_logger(__name__)
+
+# CARTO Positron tiles, the same basemap folium uses for 'cartodbpositron'
+TILE_URL = "https://a.basemaps.cartocdn.com/light_all/{z}/{x}/{y}.png"
+
+# Area covered by the heatmap viewports (Chicago plus a margin), in degrees
+BOUNDS = {
+    'north': 42.25,
+    'south': 41.35,
+    'west': -88.25,
+    'east': -87.10
+}
+
+# Leaflet rounds the maps' fractional zoom levels (10.25, 10.71) to these
+ZOOM_LEVELS = [10, 11]
+
+def tile_range(zoom: int) -> tuple:
+    """Return the (x_min, x_max, y_min, y_max) tile indices covering BOUNDS at a zoom level."""
+    def to_tile(lat: float, lon: float) -> tuple:
+        n = 2 ** zoom
+        x = int((lon + 180.0) / 360.0 * n)
+        lat_rad = math.radians(lat)
+        y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+        return x, y
+
+    x_min, y_min = to_tile(BOUNDS['north'], BOUNDS['west'])
+    x_max, y_max = to_tile(BOUNDS['south'], BOUNDS['east'])
+    return x_min, x_max, y_min, y_max
+
+def cache_tiles(tile_dir: Path) -> int:
+    """Download every tile covering the heatmap area that is not already cached.
+
+    Args:
+        tile_dir: Directory tiles are written to as {z}/{x}/{y}.png.
+
+    Returns:
+        Number of tiles downloaded.
+    """
+    session = requests.Session()
+    session.headers['User-Agent'] = 'chicago_dig_bot'
+    downloaded = 0
+    
+    # The heatmaps only use the cache once the marker exists, so drop it until
+    # this run has fetched every tile
+    marker = tile_dir / TILE_CACHE_MARKER
+    marker.unlink(missing_ok=True)
+
+    for zoom in ZOOM_LEVELS:
+        x_min, x_max, y_min, y_max = tile_range(zoom)
+        logger.info(f"Zoom {zoom}: tiles x={x_min}-{x_max}, y={y_min}-{y_max}")
+
+        for x in range(x_min, x_max + 1):
+            for y in range(y_min, y_max + 1):
+                tile_path = tile_dir / str(zoom) / str(x) / f"{y}.png"
+                if tile_path.exists():
+                    continue
+
+                response = session.get(TILE_URL.format(z=zoom, x=x, y=y), timeout=30)
+                response.raise_for_status()
+                tile_path.parent.mkdir(parents=True, exist_ok=True)
+                tile_path.write_bytes(response.content)
+                downloaded += 1
+
+    marker.write_text(' '.join(str(zoom) for zoom in ZOOM_LEVELS))
+    return downloaded
+
+def main():
+    try:
+        setup_logging()
+        tile_dir = config.heatmap_tile_dir
+        logger.info(f"Caching map tiles to {tile_dir}")
+        downloaded = cache_tiles(tile_dir)
+        logger.info(f"Downloaded {downloaded} new tiles")
+    except Exception as e:
+        logger.error(f"Failed to cache map tiles: {str(e)}")
+        raise
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,23 @@
 """Logging configuration for the Chicago Dig Bot."""
+import gzip
 import logging
 import logging.handlers
 import os
+import shutil
 from pathlib import Path
 import colorlog
 from src.config import config
 
+def _gzip_namer(name: str) -> str:
+    """Name rotated log files with a .gz suffix."""
+    return name + ".gz"
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    """Compress the rotated log file into dest and remove the original."""
+    with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
 def setup_logging():
     """Configure logging based on settings in config.yaml."""
     # Create logs directory if it doesn't exist
@@ -29,12 +41,16 @@ def setup_logging():
         }
     )
 
-    # Configure rotating file handler
+    # Configure rotating file handler (opened lazily, rotated files gzipped)
     file_handler = logging.handlers.RotatingFileHandler(
         filename=config.logging_config['file'],
         maxBytes=config.logging_config['rotation']['max_bytes'],
-        backupCount=config.logging_config['rotation']['backup_count']
+        backupCount=config.logging_config['rotation']['backup_count'],
+        encoding='utf-8',
+        delay=True
     )
+    file_handler.namer = _gzip_namer
+    file_handler.rotator = _gzip_rotator
     file_handler.setFormatter(file_formatter)
 
     # Configure colored console handler
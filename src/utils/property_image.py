@@ -1,12 +1,17 @@
 """Module for fetching property images from Google Street View."""
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut
-import time
+from geopy.extra.rate_limiter import RateLimiter
 from datetime import datetime
 import pytz
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional
 from src.utils.logging import get_logger
 from dotenv import load_dotenv
 
@@ -15,26 +20,77 @@ load_dotenv()
 
 logger = get_logger(__name__)
 
+# Buffer size used when streaming images to disk
+IMAGE_CHUNK_SIZE = 64 * 1024
+
+# Characters stripped from addresses when building image filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9 _-]+')
+MAX_FILENAME_ADDRESS_LENGTH = 120
+
+STREET_VIEW_URL = "https://maps.googleapis.com/maps/api/streetview"
+
+# Retry policy for transient HTTP failures
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Worker threads used by process_addresses
+MAX_WORKERS = 8
+
+def _create_session() -> requests.Session:
+    """Create an HTTP session that retries transient failures with exponential backoff."""
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET'])
+    )
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(max_retries=retry))
+    return session
+
+# Shared across bot instances so repeat requests reuse pooled connections
+_SESSION = _create_session()
+_API_KEY = os.getenv('GOOGLE_MAPS_API_KEY')
+_GEOLOCATOR = Nominatim(
+    user_agent="chicago_dig_bot",
+    timeout=5  # Increase timeout to 5 seconds
+)
+# Honour Nominatim's 1 request/second policy (shared by all threads) and retry
+# timeouts/service errors with a fixed wait between attempts
+_GEOCODE = RateLimiter(
+    _GEOLOCATOR.geocode,
+    min_delay_seconds=1.0,
+    max_retries=MAX_RETRIES,
+    error_wait_seconds=1.0,
+    swallow_exceptions=False
+)
+
 class PropertyImageError(Exception):
     """Custom exception for property image fetching errors."""
     pass
 
 class PropertyImageBot:
     def __init__(self):
-        """Initialize the property image bot with geocoder and API key."""
-        self.geolocator = Nominatim(
-            user_agent="chicago_dig_bot",
-            timeout=5  # Increase timeout to 5 seconds
-        )
-        self.api_key = os.getenv('GOOGLE_MAPS_API_KEY')
+        """Initialize the property image bot with the shared geocoder, session and API key."""
+        self.geolocator = _GEOLOCATOR
+        self.geocode = _GEOCODE
+        self.session = _SESSION
+        self.api_key = _API_KEY
         if not self.api_key:
             raise PropertyImageError("GOOGLE_MAPS_API_KEY environment variable not found")
         
         # Ensure images directory exists
         self.images_dir = Path("output/images")
         self.images_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _timestamp() -> str:
+        """Return the current Chicago time formatted for image filenames."""
+        return datetime.now(pytz.timezone('America/Chicago')).strftime('%Y%m%d_%H%M%S')
         
-    def get_street_view_image(self, lat: float, lon: float, address: str) -> str:
+    def get_street_view_image(self, lat: float, lon: float, address: str,
+                              timestamp: Optional[str] = None) -> str:
         """
         Fetches a Street View image for given coordinates using Google Street View Static API
         
@@ -42,6 +98,9 @@ class PropertyImageBot:
             lat: Latitude coordinate
             lon: Longitude coordinate
             address: Address string for filename
+            timestamp: Optional precomputed filename stamp (YYYYmmdd_HHMMSS); batch
+                callers pass one shared value, suffixed per item, so it is only
+                formatted once
             
         Returns:
             Path to saved image file
@@ -50,38 +109,69 @@ class PropertyImageBot:
             PropertyImageError: If image fetch fails
         """
         try:
-            base_url = "https://maps.googleapis.com/maps/api/streetview"
+            # Check the free metadata endpoint first so we don't spend image
+            # quota on locations without Street View coverage
+            metadata = self.session.get(
+                f"{STREET_VIEW_URL}/metadata",
+                params={'location': f'{lat},{lon}', 'key': self.api_key},
+                timeout=5
+            ).json()
+            if metadata.get('status') != 'OK':
+                raise PropertyImageError(
+                    f"No Street View imagery available at {lat},{lon}: {metadata.get('status')}"
+                )
+            
             params = {
                 'size': '600x400',  # Image size
                 'location': f'{lat},{lon}',
                 'key': self.api_key,
-                'return_error_code': True
+                'return_error_code': 'true'  # 404 instead of a grey placeholder image
             }
             
-            response = requests.get(f"{base_url}", params=params, timeout=10)  # Add 10 second timeout
+            # Stream the body straight to disk instead of buffering response.content
+            response = self.session.get(
+                STREET_VIEW_URL,
+                params=params,
+                stream=True,
+                timeout=(3.05, 10)  # (connect, read) timeouts in seconds
+            )
             
-            if response.status_code == 200:
+            with response:
+                if response.status_code != 200:
+                    raise PropertyImageError(f"Failed to fetch Street View image: {response.status_code}")
+                
                 # Create filename from sanitized address
-                safe_address = "".join(x for x in address if x.isalnum() or x in (' ', '-', '_'))
-                chicago_tz = pytz.timezone('America/Chicago')
-                chicago_now = datetime.now(chicago_tz)
-                filename = self.images_dir / f"{safe_address}_{chicago_now.strftime('%Y%m%d_%H%M%S')}.jpg"
+                safe_address = _UNSAFE_FILENAME_CHARS.sub('', address)[:MAX_FILENAME_ADDRESS_LENGTH].strip().replace(' ', '_')
+                if timestamp is None:
+                    timestamp = self._timestamp()
+                filename = self.images_dir / f"{safe_address}_{timestamp}.jpg"
                 
-                with open(filename, 'wb') as f:
-                    f.write(response.content)
+                # Stream into a temporary file and move it into place only once
+                # the whole body has arrived, so a dropped connection never
+                # leaves a truncated image behind
+                temp_filename = filename.with_name(filename.name + '.part')
+                try:
+                    with open(temp_filename, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=IMAGE_CHUNK_SIZE):
+                            f.write(chunk)
+                    os.replace(temp_filename, filename)
+                except BaseException:
+                    temp_filename.unlink(missing_ok=True)
+                    raise
                 return str(filename)
-            else:
-                raise PropertyImageError(f"Failed to fetch Street View image: {response.status_code}")
                 
-        except Exception as e:
-            raise PropertyImageError(f"Error fetching Street View image: {str(e)}")
+        except requests.RequestException as e:
+            raise PropertyImageError(f"Error fetching Street View image: {str(e)}") from e
+        except OSError as e:
+            raise PropertyImageError(f"Error saving Street View image: {str(e)}") from e
 
-    def process_address(self, address: str) -> dict:
+    def process_address(self, address: str, timestamp: Optional[str] = None) -> dict:
         """
         Geocodes an address and fetches its Street View image
         
         Args:
             address: Address string to process
+            timestamp: Optional precomputed filename stamp passed to get_street_view_image
             
         Returns:
             Dictionary containing status, address, coordinates and image path
@@ -92,29 +182,17 @@ class PropertyImageBot:
         try:
             logger.info(f"Processing address: {address}")
             
-            # Geocode the address with retry logic
-            max_retries = 3
-            retry_delay = 1  # seconds
-            
-            for attempt in range(max_retries):
-                try:
-                    location = self.geolocator.geocode(address)
-                    if location:
-                        logger.info(f"Successfully geocoded address: {location.latitude}, {location.longitude}")
-                        break
-                    elif attempt < max_retries - 1:  # Don't sleep on last attempt
-                        time.sleep(retry_delay)
-                except GeocoderTimedOut:
-                    if attempt < max_retries - 1:  # Don't sleep on last attempt
-                        time.sleep(retry_delay)
-                    continue
-            
+            # Geocode the address (timeouts are retried by the rate limiter)
+            location = self.geocode(address)
             if location:
+                logger.info(f"Successfully geocoded address: {location.latitude}, {location.longitude}")
+                
                 # Fetch and save street view image
                 image_path = self.get_street_view_image(
                     location.latitude, 
                     location.longitude,
-                    address
+                    address,
+                    timestamp=timestamp
                 )
                 
                 return {
@@ -131,3 +209,36 @@ class PropertyImageBot:
             raise PropertyImageError("Geocoding timed out after all retries")
         except Exception as e:
             raise PropertyImageError(f"Error processing address: {str(e)}")
+
+    def process_addresses(self, addresses: List[str]) -> List[dict]:
+        """
+        Processes several addresses concurrently
+        
+        The work is I/O-bound (geocoding, image download, disk write), so a thread
+        pool overlaps the network waits. Geocoding stays limited to one request per
+        second by the shared rate limiter.
+        
+        Args:
+            addresses: Address strings to process
+            
+        Returns:
+            One result dictionary per address, in input order. Failed addresses have
+            status 'error' and an 'error' message instead of coordinates and image path
+        """
+        timestamp = self._timestamp()
+        
+        def _process(index: int, address: str) -> dict:
+            try:
+                # Suffix the shared stamp with the item's position so duplicate
+                # addresses (or ones that sanitize alike) get distinct files
+                return self.process_address(address, timestamp=f"{timestamp}_{index}")
+            except PropertyImageError as e:
+                logger.error(f"Failed to process {address}: {str(e)}")
+                return {
+                    'status': 'error',
+                    'address': address,
+                    'error': str(e)
+                }
+        
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            return list(executor.map(_process, range(len(addresses)), addresses))
@@ -1,35 +1,141 @@
 """Module for generating visualizations of Chicago 811 dig ticket data."""
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; charts are only saved to files
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
+import numpy as np
 import folium
 from folium.plugins import HeatMap
 from datetime import datetime, timedelta
 import pytz
 from pathlib import Path
 import matplotlib.dates as mdates
+from matplotlib.colors import LinearSegmentedColormap
 from src.config import config
 from src.utils.logging import get_logger
 import json
+import functools
 import osmnx as ox
 import geopandas as gpd
-from shapely.geometry import shape
+from shapely.geometry import shape, mapping
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
 import os
+import atexit
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image
+from matplotlib.patches import Patch
 import io
+import base64
+
+try:
+    import mozjpeg_lossless_optimization
+except ImportError:  # Optional: falls back to Pillow's JPEG output
+    mozjpeg_lossless_optimization = None
 
 logger = get_logger(__name__)
 
+# Tolerance in degrees when simplifying the Chicago boundary polygon
+BOUNDARY_SIMPLIFY_TOLERANCE = 0.001
+
+# JPEG quality range searched when compressing map screenshots
+MIN_JPEG_QUALITY = 60
+MAX_JPEG_QUALITY = 95
+
+# JPEG quality Chrome uses when capturing map screenshots
+SCREENSHOT_JPEG_QUALITY = 90
+
+# Width and height of the headless Chrome viewport in pixels
+SCREENSHOT_SIZE = 900
+
+# Maximum number of markers drawn per line on the daily chart
+MAX_DAILY_MARKERS = 90
+
+# Columns read by the heatmap methods
+HEATMAP_COLUMNS = ['latitude', 'longitude', 'dig_date', 'is_emergency']
+
+# Heatmap gradients (Leaflet.heat intensity stop -> color)
+REGULAR_GRADIENT = {
+    '0.4': '#E3F2FD',  # Lightest blue
+    '0.6': '#64B5F6',  # Light blue
+    '0.8': '#1E88E5',  # Medium blue
+    '1.0': '#0D47A1'   # Dark blue
+}
+EMERGENCY_GRADIENT = {
+    '0.4': '#FFEBEE',  # Lightest red
+    '0.6': '#EF5350',  # Light red
+    '0.8': '#E53935',  # Medium red
+    '1.0': '#B71C1C'   # Dark red
+}
+
+# Area covered by pre-rendered density overlays (the valid Chicago coordinate range)
+HEATMAP_EXTENT = {'south': 41.5, 'north': 42.5, 'west': -88.0, 'east': -87.0}
+DENSITY_GRID_SIZE = 900      # Grid cells per side of the overlay image
+DENSITY_SIGMA = 8            # Gaussian blur radius in grid cells
+DENSITY_MIN_VISIBLE = 0.02   # Densities below this are left transparent
+
+# Heatmap points are snapped to a grid of this many cells per degree (~50m)
+HEATMAP_BINS_PER_DEGREE = 2000
+HEATMAP_COORD_DECIMALS = 5  # ~1m, written to the map HTML
+
+# Centre of both heatmap viewports
+HEATMAP_CENTER = (41.7866, -87.6818)
+
+# Web Mercator metres per pixel at zoom 0 for 256px tiles (Leaflet's scale)
+WEB_MERCATOR_RESOLUTION = 156543.03392804097
+EARTH_RADIUS = 6378137.0
+
+# CARTO Positron tiles, the basemap folium uses for 'cartodbpositron'
+CARTO_TILE_URL = "https://a.basemaps.cartocdn.com/light_all/{z}/{x}/{y}.png"
+
+# Leaflet snaps the maps' fractional zooms (10.25, 10.71) to these tile levels
+BASEMAP_ZOOM_LEVELS = (10, 11)
+
+# Written by src/scripts/cache_map_tiles.py once every tile has been downloaded
+TILE_CACHE_MARKER = '.complete'
+
+# Resolution used by the 'static' renderer; figure size is pixels / DPI
+STATIC_MAP_DPI = 100
+
+def _boundary_style(feature: dict) -> dict:
+    """Style for the Chicago boundary outline."""
+    return {
+        'color': '#404040',
+        'weight': 1.5,
+        'fillOpacity': 0,
+    }
+
+_STYLE_INITIALIZED = False
+
+def _init_plot_style() -> None:
+    """Apply the global matplotlib/seaborn chart style once per process."""
+    global _STYLE_INITIALIZED
+    if _STYLE_INITIALIZED:
+        return
+    plt.style.use('seaborn-v0_8')
+    sns.set_style("whitegrid", {
+        'grid.linestyle': ':',
+        'grid.color': '#E0E0E0',
+        'axes.facecolor': '#F8F8F8'
+    })
+    _STYLE_INITIALIZED = True
+
 class ChartGenerationError(Exception):
     """Custom exception for chart generation errors."""
     pass
 
+def _render_heatmap(method_name: str, df: pd.DataFrame, output_path: str) -> str:
+    """Worker entry point for generate_all_heatmaps: render one already-filtered heatmap in this process."""
+    generator = ChartGenerator()
+    try:
+        return getattr(generator, method_name)(df, output_path, prefiltered=True)
+    finally:
+        generator.close()
+
 class ChartGenerator:
     """Handles generation of data visualizations."""
     
@@ -38,9 +144,43 @@ class ChartGenerator:
         self.style = config.chart_style
         self.colors = config.chart_colors
         self.max_image_size = 900 * 1024  # 900KB target size (to be safe under 976.56KB limit)
+        self._driver = None  # Headless Chrome, started lazily by _get_driver
+        self._fig = None  # Matplotlib figure/axes, created lazily by _setup_plot
+        self._ax = None
+        self.tiles, self.tiles_attr = self._basemap_tiles()
+        self.renderer = config.heatmap_style.get('renderer', 'leaflet')
+        
+        self.chicago_bounds = self._load_chicago_bounds()
+        logger.debug(f"Initialized ChartGenerator with style: {self.style}")
+
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_chicago_bounds(cls) -> dict:
+        """Load the Chicago boundary feature, shared by all instances in the process.
+        
+        The feature is read from a local GeoJSON cache when present; otherwise it is
+        geocoded with OSMnx and written to the cache for subsequent runs.
+        
+        Returns:
+            GeoJSON feature dict with Chicago's boundary geometry.
+        """
+        cache_dir = Path(config.data_dir) / 'cache'
+        cache_path = cache_dir / 'chicago_bounds.geojson'
+        try:
+            bounds = json.loads(cache_path.read_text())
+            logger.debug(f"Loaded Chicago boundary data from {cache_path}")
+            return bounds
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable boundary cache {cache_path}: {str(e)}")
         
         # Get Chicago boundary using OSMnx with a more reliable method
         try:
+            # Reuse cached HTTP responses if the geocode has to be retried
+            ox.settings.use_cache = True
+            ox.settings.cache_folder = str(cache_dir / 'osmnx')
+            
             # Use place name query which is more reliable
             gdf = ox.geocode_to_gdf('Chicago, Illinois, USA')
             
@@ -49,8 +189,13 @@ class ChartGenerator:
             # Extract the first feature's geometry (Chicago's boundary)
             geometry = geojson['features'][0]['geometry']
             
+            # Simplify the polygon (~100m tolerance) to shrink the map HTML
+            geometry = mapping(
+                shape(geometry).simplify(BOUNDARY_SIMPLIFY_TOLERANCE, preserve_topology=True)
+            )
+            
             # Create the feature with proper structure
-            self.chicago_bounds = {
+            bounds = {
                 'type': 'Feature',
                 'geometry': geometry
             }
@@ -58,7 +203,7 @@ class ChartGenerator:
         except Exception as e:
             logger.error(f"Failed to load Chicago boundary data: {str(e)}")
             # Fallback to rectangular bounds if city boundary fails to load
-            self.chicago_bounds = {
+            return {
                 "type": "Feature",
                 "geometry": {
                     "type": "Polygon",
@@ -71,13 +216,104 @@ class ChartGenerator:
                     ]]
                 }
             }
-        logger.debug(f"Initialized ChartGenerator with style: {self.style}")
+        
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(bounds))
+            logger.debug(f"Cached Chicago boundary data to {cache_path}")
+        except OSError as e:
+            logger.warning(f"Failed to cache Chicago boundary data: {str(e)}")
+        return bounds
+
+    @staticmethod
+    def _tile_cache_dir() -> Optional[Path]:
+        """Return the local tile cache directory if it is complete, else None.
+        
+        Only a cache the download script finished, with every zoom level the maps
+        need, is trusted; a partial download would render blank tiles.
+        """
+        tile_dir = config.heatmap_tile_dir
+        if tile_dir is None or not (tile_dir / TILE_CACHE_MARKER).is_file():
+            return None
+        if not all((tile_dir / str(zoom)).is_dir() for zoom in BASEMAP_ZOOM_LEVELS):
+            return None
+        return tile_dir
+
+    def _basemap_tiles(self) -> Tuple[str, Optional[str]]:
+        """Choose the basemap tile source for heatmaps.
+        
+        Tiles pre-downloaded by src/scripts/cache_map_tiles.py are loaded from
+        disk through file:// URLs so screenshots don't fetch them over the network.
+        
+        Returns:
+            Tuple of (tiles, attribution) to pass to folium.Map.
+        """
+        tile_dir = self._tile_cache_dir()
+        if tile_dir is not None:
+            logger.debug(f"Using cached map tiles from {tile_dir}")
+            return (
+                tile_dir.resolve().as_uri() + '/{z}/{x}/{y}.png',
+                '&copy; OpenStreetMap contributors &copy; CARTO'
+            )
+        return 'cartodbpositron', None
+
+    def _boundary_layer(self) -> folium.GeoJson:
+        """Build a new map layer outlining the Chicago boundary."""
+        return folium.GeoJson(self.chicago_bounds, style_function=_boundary_style)
+
+    @staticmethod
+    def _encode_jpeg(img: Image.Image, quality: int) -> bytes:
+        """Encode an image as JPEG, recompressed with mozjpeg when it is installed.
+        
+        mozjpeg's lossless pass yields smaller files at the same quality, so the
+        size target is usually met at a higher quality setting. It also rebuilds
+        the Huffman tables, so Pillow's own optimize pass is skipped in that case.
+        The returned bytes are final: callers write them as-is, never re-encode.
+        """
+        buffer = io.BytesIO()
+        img.save(buffer, format='JPEG', quality=quality,
+                 optimize=mozjpeg_lossless_optimization is None)
+        data = buffer.getvalue()
+        if mozjpeg_lossless_optimization is not None:
+            data = mozjpeg_lossless_optimization.optimize(data)
+        return data
 
-    def _compress_image(self, input_path: str, output_path: str) -> None:
+    def _find_best_quality(self, img: Image.Image) -> Optional[Tuple[int, bytes]]:
+        """Find the highest JPEG quality whose output fits within max_image_size.
+        
+        Qualities are tried in steps of 5 between MIN_JPEG_QUALITY and
+        MAX_JPEG_QUALITY. The maximum is checked first since it usually fits;
+        otherwise file size is monotonic in quality, so the rest is binary searched.
+        
+        Args:
+            img: Image to encode.
+            
+        Returns:
+            Tuple of (quality, encoded bytes), or None if no quality is small enough.
+        """
+        qualities = list(range(MIN_JPEG_QUALITY, MAX_JPEG_QUALITY + 1, 5))
+        
+        data = self._encode_jpeg(img, qualities[-1])
+        if len(data) <= self.max_image_size:
+            return qualities[-1], data
+        
+        best = None
+        lo, hi = 0, len(qualities) - 2
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            data = self._encode_jpeg(img, qualities[mid])
+            if len(data) <= self.max_image_size:
+                best = (qualities[mid], data)
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        return best
+
+    def _compress_image(self, image_data: bytes, output_path: str) -> None:
         """Compress image to meet size requirements.
         
         Args:
-            input_path: Path to the input image file.
+            image_data: Encoded input image (e.g. a JPEG screenshot).
             output_path: Path to save the compressed image.
             
         Raises:
@@ -85,29 +321,17 @@ class ChartGenerator:
         """
         try:
             # Open the image
-            with Image.open(input_path) as img:
+            with Image.open(io.BytesIO(image_data)) as img:
                 # Convert to RGB if necessary
                 if img.mode in ('RGBA', 'P'):
                     img = img.convert('RGB')
                 
-                # Start with quality 95
-                quality = 95
-                min_quality = 60  # Don't go below this quality
-                
-                while quality >= min_quality:
-                    # Save with current quality
-                    temp_buffer = io.BytesIO()
-                    img.save(temp_buffer, format='JPEG', quality=quality, optimize=True)
-                    size = temp_buffer.tell()
-                    
-                    if size <= self.max_image_size:
-                        # Save the compressed image
-                        img.save(output_path, format='JPEG', quality=quality, optimize=True)
-                        logger.info(f"Compressed image to {size/1024:.1f}KB with quality {quality}")
-                        return
-                    
-                    # Reduce quality and try again
-                    quality -= 5
+                result = self._find_best_quality(img)
+                if result:
+                    quality, data = result
+                    Path(output_path).write_bytes(data)
+                    logger.info(f"Compressed image to {len(data)/1024:.1f}KB with quality {quality}")
+                    return
                 
                 # If we get here, even lowest quality is too big
                 # Try reducing dimensions
@@ -115,19 +339,12 @@ class ChartGenerator:
                     new_size = (int(img.size[0] * 0.8), int(img.size[1] * 0.8))
                     img = img.resize(new_size, Image.Resampling.LANCZOS)
                     
-                    # Try saving with original quality first
-                    quality = 95
-                    while quality >= min_quality:
-                        temp_buffer = io.BytesIO()
-                        img.save(temp_buffer, format='JPEG', quality=quality, optimize=True)
-                        size = temp_buffer.tell()
-                        
-                        if size <= self.max_image_size:
-                            img.save(output_path, format='JPEG', quality=quality, optimize=True)
-                            logger.info(f"Compressed image to {size/1024:.1f}KB with size {img.size} and quality {quality}")
-                            return
-                        
-                        quality -= 5
+                    result = self._find_best_quality(img)
+                    if result:
+                        quality, data = result
+                        Path(output_path).write_bytes(data)
+                        logger.info(f"Compressed image to {len(data)/1024:.1f}KB with size {img.size} and quality {quality}")
+                        return
                 
                 raise ChartGenerationError("Could not compress image to meet size requirements")
                 
@@ -169,40 +386,377 @@ class ChartGenerator:
             if not pd.api.types.is_numeric_dtype(df[col]):
                 raise ChartGenerationError(f"'{col}' must contain numeric data")
 
-    def _setup_plot(self) -> None:
-        """Configure plot settings and style."""
-        try:
-            plt.style.use('seaborn-v0_8')
-            sns.set_style("whitegrid", {
-                'grid.linestyle': ':',
-                'grid.color': '#E0E0E0',
-                'axes.facecolor': '#F8F8F8'
-            })
+    def _yesterday_location_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """Build a boolean mask of yesterday's permits with valid Chicago coordinates.
+        
+        Args:
+            df: DataFrame with 'latitude', 'longitude' and 'dig_date' columns.
+            
+        Returns:
+            Boolean NumPy array aligned with the rows of df.
+        """
+        chicago_tz = pytz.timezone('America/Chicago')
+        yesterday = np.datetime64(datetime.now(chicago_tz).date() - timedelta(days=1), 'D')
+        
+        # Compare calendar days in Chicago local time without per-row date objects;
+        # object columns of datetimes are coerced to datetime64 first (a no-op otherwise)
+        dig_dates = pd.to_datetime(df['dig_date'])
+        if dig_dates.dt.tz is not None:
+            dig_dates = dig_dates.dt.tz_convert(chicago_tz).dt.tz_localize(None)
+        days = dig_dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+        
+        lat = df['latitude'].to_numpy(dtype=float, na_value=np.nan)
+        lon = df['longitude'].to_numpy(dtype=float, na_value=np.nan)
+        return (
+            (days == yesterday) &
+            (lat >= 41.5) & (lat <= 42.5) &    # Valid Chicago latitude range
+            (lon >= -88) & (lon <= -87) &      # Valid Chicago longitude range
+            (lat != 0) & (lon != 0)            # Remove 0 values
+        )
+
+    def _filter_yesterday_valid(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return yesterday's permits with valid Chicago coordinates.
+        
+        Raises:
+            ChartGenerationError: If no rows remain after filtering.
+        """
+        mask = self._yesterday_location_mask(df)
+        if not mask.any():
+            raise ChartGenerationError("No valid location data after filtering")
+        return df[mask]
+
+    def _heatmap_mask(self, df: pd.DataFrame, prefiltered: bool) -> np.ndarray:
+        """Return the mask of rows a heatmap plots.
+        
+        Args:
+            df: DataFrame with location and 'dig_date' columns.
+            prefiltered: Whether df already holds only yesterday's valid rows
+                (see _filter_yesterday_valid), so validation and filtering are skipped.
             
-            plt.figure(figsize=self.style['figure_size'], dpi=self.style['dpi'])
-            logger.debug(f"Created figure with size {self.style['figure_size']} and DPI {self.style['dpi']}")
+        Raises:
+            ChartGenerationError: If the data is invalid or no rows remain.
+        """
+        if prefiltered:
+            return np.ones(len(df), dtype=bool)
+        
+        self._validate_location_data(df)
+        
+        # Keep yesterday's permits with valid Chicago coordinates
+        mask = self._yesterday_location_mask(df)
+        if not mask.any():
+            raise ChartGenerationError("No valid location data after filtering")
+        return mask
+
+    def _heat_layer(self, lat: np.ndarray, lon: np.ndarray, gradient: Dict[str, str],
+                    name: Optional[str] = None) -> folium.map.Layer:
+        """Build a heatmap layer for the given points.
+        
+        With the 'leaflet' renderer the (binned) points are drawn by Leaflet.heat
+        in the browser; with 'overlay' the density is computed here and embedded
+        as a single image, so the browser only has to draw one picture.
+        
+        Args:
+            lat: Latitudes of the points.
+            lon: Longitudes of the points.
+            gradient: Leaflet.heat style gradient of intensity stop -> color.
+            name: Optional layer name.
+            
+        Returns:
+            A folium layer ready to add to a map.
+        """
+        if self.renderer == 'overlay':
+            return folium.raster_layers.ImageOverlay(
+                image=self._density_image_url(lat, lon, gradient),
+                bounds=[[HEATMAP_EXTENT['south'], HEATMAP_EXTENT['west']],
+                        [HEATMAP_EXTENT['north'], HEATMAP_EXTENT['east']]],
+                name=name
+            )
+        return HeatMap(
+            self._bin_locations(lat, lon),
+            name=name,
+            radius=15,
+            blur=20,
+            max_zoom=13,
+            min_opacity=0.4,
+            gradient=gradient
+        )
+
+    @staticmethod
+    def _density_grid(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        """Compute a normalized, Gaussian-smoothed point density grid.
+        
+        Args:
+            lat: Latitudes of the points.
+            lon: Longitudes of the points.
+            
+        Returns:
+            2D array in [0, 1] over HEATMAP_EXTENT, with row 0 at the north edge.
+        """
+        grid, _, _ = np.histogram2d(
+            lat, lon,
+            bins=DENSITY_GRID_SIZE,
+            range=[[HEATMAP_EXTENT['south'], HEATMAP_EXTENT['north']],
+                   [HEATMAP_EXTENT['west'], HEATMAP_EXTENT['east']]]
+        )
+        
+        # Separable Gaussian blur: convolve every column, then every row
+        radius = int(3 * DENSITY_SIGMA)
+        offsets = np.arange(-radius, radius + 1)
+        kernel = np.exp(-offsets ** 2 / (2 * DENSITY_SIGMA ** 2))
+        kernel /= kernel.sum()
+        grid = np.apply_along_axis(np.convolve, 0, grid, kernel, mode='same')
+        grid = np.apply_along_axis(np.convolve, 1, grid, kernel, mode='same')
+        
+        # Square-root scaling lifts sparse areas the way Leaflet.heat's additive
+        # blending does, instead of letting the densest cluster wash out the rest
+        peak = grid.max()
+        if peak > 0:
+            grid = np.sqrt(np.clip(grid, 0, None) / peak)
+        return grid[::-1]
+
+    def _density_rgba(self, lat: np.ndarray, lon: np.ndarray, gradient: Dict[str, str]) -> np.ndarray:
+        """Render the point density as an RGBA array colored with a heatmap gradient."""
+        density = self._density_grid(lat, lon)
+        
+        # Same color stops as Leaflet.heat; low intensities use the first color
+        stops = sorted((float(stop), color) for stop, color in gradient.items())
+        cmap = LinearSegmentedColormap.from_list(
+            'heat', [(0.0, stops[0][1])] + stops
+        )
+        rgba = cmap(density)
+        rgba[..., 3] = np.where(density > DENSITY_MIN_VISIBLE, np.maximum(density, 0.4), 0)
+        return rgba
+
+    def _density_image_url(self, lat: np.ndarray, lon: np.ndarray, gradient: Dict[str, str]) -> str:
+        """Render the point density as a PNG data URL colored with a heatmap gradient."""
+        rgba = self._density_rgba(lat, lon, gradient)
+        buffer = io.BytesIO()
+        Image.fromarray((rgba * 255).astype(np.uint8), mode='RGBA').save(buffer, format='PNG')
+        return 'data:image/png;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+    @staticmethod
+    def _bin_locations(lat: np.ndarray, lon: np.ndarray) -> list:
+        """Aggregate points into a coarse grid of weighted heatmap points.
+        
+        Leaflet.heat sums point intensities per cell, so grid cells weighted by
+        their point count render the same map with far fewer points to draw.
+        
+        Args:
+            lat: Latitudes of the points.
+            lon: Longitudes of the points.
+            
+        Returns:
+            List of [lat, lon, count] triples, one per occupied grid cell.
+        """
+        if len(lat) == 0:
+            return []
+        binned = np.round(np.column_stack([lat, lon]) * HEATMAP_BINS_PER_DEGREE) / HEATMAP_BINS_PER_DEGREE
+        cells, counts = np.unique(binned, axis=0, return_counts=True)
+        # Drop float noise (41.850500000000004) so the embedded JSON stays short
+        return np.column_stack([cells.round(HEATMAP_COORD_DECIMALS), counts]).tolist()
+
+    def _setup_plot(self) -> plt.Axes:
+        """Configure plot settings and style.
+        
+        The figure is created on first use and reused for later charts; its axes
+        are cleared before each chart.
+        
+        Returns:
+            The cleared axes to draw on.
+        """
+        try:
+            if self._fig is None:
+                _init_plot_style()
+                self._fig, self._ax = plt.subplots(
+                    figsize=self.style['figure_size'], dpi=self.style['dpi']
+                )
+                logger.debug(f"Created figure with size {self.style['figure_size']} and DPI {self.style['dpi']}")
+            else:
+                self._ax.clear()
+            return self._ax
                 
         except Exception as e:
             error_msg = f"Failed to setup plot: {str(e)}"
             logger.error(error_msg)
             raise ChartGenerationError(error_msg)
 
-    def _capture_map_screenshot(self, html_path: str, output_path: str) -> None:
-        """Capture a screenshot of the HTML map using Selenium."""
-        try:
+    def _get_driver(self) -> webdriver.Chrome:
+        """Return the headless Chrome driver, starting it on first use.
+        
+        The driver is kept for the lifetime of the generator so later screenshots
+        skip Chrome startup; call close() (also run at exit) to shut it down.
+        """
+        if self._driver is None:
             # Setup Chrome options for headless mode
             chrome_options = Options()
             chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--window-size=900,900")
+            chrome_options.add_argument(f"--window-size={SCREENSHOT_SIZE},{SCREENSHOT_SIZE}")
             chrome_options.add_argument("--hide-scrollbars")
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
             
             # Initialize driver
-            driver = webdriver.Chrome(options=chrome_options)
+            self._driver = webdriver.Chrome(options=chrome_options)
+            atexit.register(self.close)
+            
+            # Fix the viewport before any page loads, so Leaflet lays out its
+            # tile grid once at the final size instead of re-tiling on a resize
+            self._driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+                "width": SCREENSHOT_SIZE,
+                "height": SCREENSHOT_SIZE,
+                "deviceScaleFactor": 1,
+                "mobile": False
+            })
+            logger.debug("Started headless Chrome driver")
+        return self._driver
+
+    def close(self) -> None:
+        """Shut down the headless Chrome driver if it is running."""
+        if self._driver is None:
+            return
+        atexit.unregister(self.close)
+        try:
+            self._driver.quit()
+            logger.debug("Closed headless Chrome driver")
+        except Exception as e:
+            logger.warning(f"Error closing Chrome driver: {str(e)}")
+        finally:
+            self._driver = None
+
+    def _save_jpeg(self, image_data: bytes, output_path: str) -> None:
+        """Write JPEG bytes to disk, recompressing only if they exceed the size limit."""
+        if len(image_data) <= self.max_image_size:
+            # The JPEG already fits, so skip the decode/re-encode
+            Path(output_path).write_bytes(image_data)
+            logger.info(f"Image is {len(image_data)/1024:.1f}KB, saved without recompression")
+        else:
+            self._compress_image(image_data, output_path)
+
+    @staticmethod
+    def _to_web_mercator(lat: float, lon: float) -> Tuple[float, float]:
+        """Project a WGS84 coordinate to Web Mercator (EPSG:3857) metres."""
+        x = EARTH_RADIUS * np.radians(lon)
+        y = EARTH_RADIUS * np.log(np.tan(np.pi / 4 + np.radians(lat) / 2))
+        return x, y
+
+    @staticmethod
+    def _add_cached_basemap(ax: plt.Axes, tile_dir: Path, zoom: int) -> None:
+        """Draw the locally cached tiles covering the axes' Web Mercator extent.
+        
+        Raises:
+            FileNotFoundError: If a tile in the extent is missing from the cache.
+        """
+        origin = np.pi * EARTH_RADIUS  # Web Mercator half-width of the world
+        tile_span = 2 * origin / 2 ** zoom
+        x_min, x_max = ax.get_xlim()
+        y_min, y_max = ax.get_ylim()
+        cols = range(int((x_min + origin) // tile_span), int((x_max + origin) // tile_span) + 1)
+        rows = range(int((origin - y_max) // tile_span), int((origin - y_min) // tile_span) + 1)
+        
+        mosaic = Image.new('RGB', (256 * len(cols), 256 * len(rows)))
+        for i, x in enumerate(cols):
+            for j, y in enumerate(rows):
+                with Image.open(tile_dir / str(zoom) / str(x) / f"{y}.png") as tile:
+                    mosaic.paste(tile.convert('RGB'), (256 * i, 256 * j))
+        
+        ax.imshow(
+            np.asarray(mosaic),
+            extent=(cols[0] * tile_span - origin, (cols[-1] + 1) * tile_span - origin,
+                    origin - (rows[-1] + 1) * tile_span, origin - rows[0] * tile_span),
+            interpolation='bilinear',
+            zorder=0
+        )
+
+    def _render_static_map(self, layers: list, output_path: str, zoom: float,
+                           legend: bool = False) -> None:
+        """Rasterize a heatmap with matplotlib instead of a headless browser.
+        
+        Reproduces the screenshot viewport (same centre, snapped zoom and pixel
+        size) in Web Mercator, draws the precomputed density images and the
+        Chicago boundary, and adds basemap tiles from the local cache or, without
+        one, through contextily. Chrome is never started.
+        
+        Args:
+            layers: (lat, lon, gradient, label) tuples, drawn in order.
+            output_path: Path to save the JPEG image.
+            zoom: Leaflet zoom level of the map; snapped to a whole level like
+                Leaflet does.
+            legend: Whether to draw a legend of the layer labels.
+            
+        Raises:
+            ChartGenerationError: If the image cannot be rendered or saved.
+        """
+        import contextily as cx
+        
+        # Leaflet's default zoomSnap of 1 renders 10.25 / 10.71 at zoom 10 / 11
+        tile_zoom = int(round(zoom))
+        size = SCREENSHOT_SIZE / STATIC_MAP_DPI
+        fig = plt.figure(figsize=(size, size), dpi=STATIC_MAP_DPI)
+        try:
+            ax = fig.add_axes([0, 0, 1, 1])
+            ax.set_axis_off()
             
-            # Set viewport size
-            driver.set_window_size(900, 900)
+            # Viewport matching the screenshot's centre, zoom and size
+            center_x, center_y = self._to_web_mercator(*HEATMAP_CENTER)
+            half_span = SCREENSHOT_SIZE / 2 * WEB_MERCATOR_RESOLUTION / 2 ** tile_zoom
+            ax.set_xlim(center_x - half_span, center_x + half_span)
+            ax.set_ylim(center_y - half_span, center_y + half_span)
+            
+            try:
+                tile_dir = self._tile_cache_dir()
+                if tile_dir is not None:
+                    self._add_cached_basemap(ax, tile_dir, tile_zoom)
+                else:
+                    cx.add_basemap(
+                        ax,
+                        source=CARTO_TILE_URL,
+                        zoom=tile_zoom,
+                        attribution=False
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to load basemap tiles, rendering without them: {str(e)}")
+            
+            gpd.GeoDataFrame.from_features([self.chicago_bounds], crs='EPSG:4326').to_crs('EPSG:3857').plot(
+                ax=ax, facecolor='none', edgecolor='#404040', linewidth=1.5
+            )
+            
+            west, south = self._to_web_mercator(HEATMAP_EXTENT['south'], HEATMAP_EXTENT['west'])
+            east, north = self._to_web_mercator(HEATMAP_EXTENT['north'], HEATMAP_EXTENT['east'])
+            for lat, lon, gradient, _ in layers:
+                ax.imshow(
+                    self._density_rgba(lat, lon, gradient),
+                    extent=(west, east, south, north),
+                    interpolation='bilinear',
+                    zorder=3
+                )
+            
+            # imshow and the basemap widen the limits; restore the viewport
+            ax.set_xlim(center_x - half_span, center_x + half_span)
+            ax.set_ylim(center_y - half_span, center_y + half_span)
+            
+            if legend:
+                handles = [
+                    Patch(facecolor=gradient['1.0'], edgecolor='none', label=label)
+                    for _, _, gradient, label in layers
+                ]
+                ax.legend(handles=handles, loc='upper right', fontsize=14, framealpha=1)
+            
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format='jpeg', dpi=STATIC_MAP_DPI,
+                        pil_kwargs={'quality': SCREENSHOT_JPEG_QUALITY})
+            self._save_jpeg(buffer.getvalue(), output_path)
+            
+        except Exception as e:
+            error_msg = f"Failed to render static map: {str(e)}"
+            logger.error(error_msg)
+            raise ChartGenerationError(error_msg)
+        finally:
+            plt.close(fig)
+
+    def _capture_map_screenshot(self, html_path: str, output_path: str) -> None:
+        """Capture a screenshot of the HTML map using Selenium."""
+        try:
+            driver = self._get_driver()
             
             # Get absolute path to HTML file
             abs_path = os.path.abspath(html_path)
@@ -211,105 +765,73 @@ class ChartGenerator:
             # Load the HTML file
             driver.get(file_url)
             
-            # Wait for map to render
-            time.sleep(5)
-            
+            # Wait until the page has loaded and every map tile has finished loading
             try:
-                WebDriverWait(driver, 10).until(
+                WebDriverWait(driver, 15).until(
                     lambda d: d.execute_script(
                         "return document.readyState === 'complete' && "
-                        "document.querySelector('.leaflet-tile-loaded') !== null"
+                        "document.querySelector('.leaflet-tile-loaded') !== null && "
+                        "document.querySelectorAll('.leaflet-tile:not(.leaflet-tile-loaded)').length === 0"
                     )
                 )
             except Exception as e:
                 logger.warning(f"Timeout waiting for map tiles: {e}")
             
-            time.sleep(2)
-            
-            # Take screenshot to temporary file
-            temp_path = output_path + '.temp.png'
-            driver.save_screenshot(temp_path)
-            
-            # Close driver
-            driver.quit()
-            
-            # Compress the screenshot
-            self._compress_image(temp_path, output_path)
+            # Let the browser paint the loaded tiles and heatmap canvas
+            driver.execute_async_script(
+                "const done = arguments[arguments.length - 1];"
+                "requestAnimationFrame(() => requestAnimationFrame(() => done(true)));"
+            )
             
-            # Remove temporary file
-            Path(temp_path).unlink()
+            # Have Chrome encode the screenshot as JPEG directly, skipping the
+            # PNG encode/decode round trip through a temporary file
+            result = driver.execute_cdp_cmd("Page.captureScreenshot", {
+                "format": "jpeg",
+                "quality": SCREENSHOT_JPEG_QUALITY,
+                "captureBeyondViewport": False
+            })
+            self._save_jpeg(base64.b64decode(result['data']), output_path)
             
             logger.info(f"Successfully captured and compressed screenshot to {output_path}")
             
         except Exception as e:
             error_msg = f"Failed to capture map screenshot: {str(e)}"
             logger.error(error_msg)
+            # Discard the driver so the next capture starts from a fresh browser
+            self.close()
             raise ChartGenerationError(error_msg)
 
-    def create_heatmap(self, df: pd.DataFrame, output_path: str) -> str:
+    def create_heatmap(self, df: pd.DataFrame, output_path: str, prefiltered: bool = False) -> str:
         """Create a heatmap visualization of dig ticket locations."""
         try:
             logger.info("Starting heatmap generation")
             
-            # Validate location data
-            self._validate_location_data(df)
-            
-            # Filter for permits from yesterday only
-            chicago_tz = pytz.timezone('America/Chicago')
-            chicago_now = datetime.now(chicago_tz)
-            yesterday = chicago_now.date() - timedelta(days=1)
-            df = df[df['dig_date'].dt.date == yesterday]
-            
-            # Filter out invalid coordinates
-            df = df[
-                (df['latitude'].between(41.5, 42.5)) &  # Valid Chicago latitude range
-                (df['longitude'].between(-88, -87)) &   # Valid Chicago longitude range
-                (df['latitude'] != 0) &                 # Remove 0 values
-                (df['longitude'] != 0)                  # Remove 0 values
-            ]
-            
-            if df.empty:
-                raise ChartGenerationError("No valid location data after filtering")
+            mask = self._heatmap_mask(df, prefiltered)
+            logger.info(f"Processing {mask.sum()} permits with valid coordinates")
+            lat = df['latitude'].to_numpy(dtype=float, na_value=np.nan)[mask]
+            lon = df['longitude'].to_numpy(dtype=float, na_value=np.nan)[mask]
             
-            logger.info(f"Processing {len(df)} permits with valid coordinates")
+            if self.renderer == 'static':
+                self._render_static_map([(lat, lon, REGULAR_GRADIENT, None)], output_path, zoom=10.25)
+                logger.info(f"Saved heatmap to {output_path}")
+                return output_path
             
             # Create base map centered on Chicago with no zoom controls
             m = folium.Map(
-                location=[41.7866, -87.6818],  # Adjusted center coordinates south
+                location=list(HEATMAP_CENTER),  # Adjusted center coordinates south
                 zoom_start=10.25,  # Decreased zoom level to show more area
-                tiles='cartodbpositron',
+                tiles=self.tiles,
+                attr=self.tiles_attr,
                 width=900,
                 height=900,
                 zoomControl=False  # Remove zoom controls
             )
             
             # Add Chicago boundary
-            folium.GeoJson(
-                self.chicago_bounds,
-                style_function=lambda x: {
-                    'color': '#404040',
-                    'weight': 1.5,
-                    'fillOpacity': 0,
-                }
-            ).add_to(m)
-            
-            # Prepare heatmap data
-            locations = df[['latitude', 'longitude']].values.tolist()
+            self._boundary_layer().add_to(m)
             
             # Add heatmap layer with monochromatic blue gradient
-            HeatMap(
-                locations,
-                radius=15,
-                blur=20,
-                max_zoom=13,
-                min_opacity=0.4,
-                gradient={
-                    '0.4': '#E3F2FD',  # Lightest blue
-                    '0.6': '#64B5F6',  # Light blue
-                    '0.8': '#1E88E5',  # Medium blue
-                    '1.0': '#0D47A1'   # Dark blue
-                }
-            ).add_to(m)
+            self._heat_layer(lat, lon, REGULAR_GRADIENT).add_to(m)
             
             # Save map to temporary HTML file
             temp_html = output_path + '.temp.html'
@@ -330,100 +852,69 @@ class ChartGenerator:
             logger.error(error_msg)
             raise ChartGenerationError(error_msg)
 
-    def create_emergency_heatmap(self, df: pd.DataFrame, output_path: str) -> str:
+    def create_emergency_heatmap(self, df: pd.DataFrame, output_path: str,
+                                 prefiltered: bool = False) -> str:
         """Create a heatmap visualization distinguishing emergency vs regular dig tickets."""
         try:
             logger.info("Starting emergency heatmap generation")
             
-            # Validate location data
-            self._validate_location_data(df)
             if 'is_emergency' not in df.columns:
                 raise ChartGenerationError("Missing 'is_emergency' column")
-            
-            # Filter for permits from yesterday only
-            chicago_tz = pytz.timezone('America/Chicago')
-            chicago_now = datetime.now(chicago_tz)
-            yesterday = chicago_now.date() - timedelta(days=1)
-            df = df[df['dig_date'].dt.date == yesterday]
-            
-            # Filter out invalid coordinates
-            df = df[
-                (df['latitude'].between(41.5, 42.5)) &  # Valid Chicago latitude range
-                (df['longitude'].between(-88, -87)) &   # Valid Chicago longitude range
-                (df['latitude'] != 0) &                 # Remove 0 values
-                (df['longitude'] != 0)                  # Remove 0 values
-            ]
-            
-            if df.empty:
-                raise ChartGenerationError("No valid location data after filtering")
-            
-            logger.info(f"Processing {len(df)} permits with valid coordinates")
+            mask = self._heatmap_mask(df, prefiltered)
+            logger.info(f"Processing {mask.sum()} permits with valid coordinates")
+            
+            # Split into emergency and regular with boolean masks over the column
+            # arrays instead of copying the frame; missing flags count as regular
+            is_emergency = df['is_emergency'].to_numpy(dtype=bool, na_value=False)
+            lat = df['latitude'].to_numpy(dtype=float, na_value=np.nan)
+            lon = df['longitude'].to_numpy(dtype=float, na_value=np.nan)
+            emergency_mask = mask & is_emergency
+            regular_mask = mask & ~is_emergency
+            
+            if self.renderer == 'static':
+                layers = [
+                    (lat[part], lon[part], gradient, label)
+                    for part, gradient, label in [
+                        (regular_mask, REGULAR_GRADIENT, "Regular Permits"),
+                        (emergency_mask, EMERGENCY_GRADIENT, "Emergency Permits")
+                    ]
+                    if part.any()
+                ]
+                self._render_static_map(layers, output_path, zoom=10.71, legend=True)
+                logger.info(f"Saved emergency heatmap to {output_path}")
+                return output_path
             
             # Create base map centered on Chicago with no zoom controls
             m = folium.Map(
-                location=[41.7866, -87.6818],  # Adjusted center coordinates south
+                location=list(HEATMAP_CENTER),  # Adjusted center coordinates south
                 zoom_start=10.71,  # Decreased zoom level to show more area
-                tiles='cartodbpositron',
+                tiles=self.tiles,
+                attr=self.tiles_attr,
                 width=950,
                 height=950,
                 zoomControl=False  # Remove zoom controls
             )
             
             # Add Chicago boundary
-            folium.GeoJson(
-                self.chicago_bounds,
-                style_function=lambda x: {
-                    'color': '#404040',
-                    'weight': 1.5,
-                    'fillOpacity': 0,
-                }
-            ).add_to(m)
-            
-            # Convert emergency column to boolean if it's not already
-            df = df.copy()
-            df['is_emergency'] = df['is_emergency'].astype(bool)
-            
-            # Split data into emergency and regular
-            emergency_df = df[df['is_emergency']]
-            regular_df = df[~df['is_emergency']]
+            self._boundary_layer().add_to(m)
             
             # Add regular tickets heatmap layer with monochromatic blue gradient
-            regular_locations = regular_df[['latitude', 'longitude']].values.tolist()
-            if regular_locations:
-                regular_heatmap = HeatMap(
-                    regular_locations,
-                    name="Regular Permits",
-                    radius=15,
-                    blur=20,
-                    max_zoom=13,
-                    min_opacity=0.4,
-                    gradient={
-                        '0.4': '#E3F2FD',  # Lightest blue
-                        '0.6': '#64B5F6',  # Light blue
-                        '0.8': '#1E88E5',  # Medium blue
-                        '1.0': '#0D47A1'   # Dark blue
-                    }
-                )
-                regular_heatmap.add_to(m)
+            if regular_mask.any():
+                self._heat_layer(
+                    lat[regular_mask],
+                    lon[regular_mask],
+                    REGULAR_GRADIENT,
+                    name="Regular Permits"
+                ).add_to(m)
             
             # Add emergency tickets heatmap layer with monochromatic red gradient
-            emergency_locations = emergency_df[['latitude', 'longitude']].values.tolist()
-            if emergency_locations:
-                emergency_heatmap = HeatMap(
-                    emergency_locations,
-                    name="Emergency Permits",
-                    radius=15,
-                    blur=20,
-                    max_zoom=13,
-                    min_opacity=0.4,
-                    gradient={
-                        '0.4': '#FFEBEE',  # Lightest red
-                        '0.6': '#EF5350',  # Light red
-                        '0.8': '#E53935',  # Medium red
-                        '1.0': '#B71C1C'   # Dark red
-                    }
-                )
-                emergency_heatmap.add_to(m)
+            if emergency_mask.any():
+                self._heat_layer(
+                    lat[emergency_mask],
+                    lon[emergency_mask],
+                    EMERGENCY_GRADIENT,
+                    name="Emergency Permits"
+                ).add_to(m)
             
             # Add legend in top right with improved visibility
             legend_html = '''
@@ -467,6 +958,42 @@ class ChartGenerator:
             logger.error(error_msg)
             raise ChartGenerationError(error_msg)
 
+    def generate_all_heatmaps(self, df: pd.DataFrame, paths: Dict[str, str]) -> Dict[str, str]:
+        """Render the regular and emergency heatmaps concurrently.
+        
+        Each heatmap is rendered in its own worker process with its own Chrome
+        driver, so the two browser captures overlap instead of running back to
+        back. Scripts calling this must guard their entry point with
+        ``if __name__ == '__main__'``.
+        
+        Args:
+            df: DataFrame with location, 'dig_date' and 'is_emergency' columns.
+            paths: Output paths keyed by 'heatmap' and 'emergency_heatmap'.
+            
+        Returns:
+            Dictionary mapping the same keys to the saved image paths.
+            
+        Raises:
+            ChartGenerationError: If either heatmap fails.
+        """
+        # Filter once here so the workers only receive yesterday's valid rows
+        # and the columns the heatmaps read, and skip re-filtering them
+        self._validate_location_data(df)
+        if 'is_emergency' not in df.columns:
+            raise ChartGenerationError("Missing 'is_emergency' column")
+        df = self._filter_yesterday_valid(df[HEATMAP_COLUMNS])
+        methods = {
+            'heatmap': 'create_heatmap',
+            'emergency_heatmap': 'create_emergency_heatmap'
+        }
+        
+        with ProcessPoolExecutor(max_workers=len(methods)) as executor:
+            futures = {
+                key: executor.submit(_render_heatmap, method, df, paths[key])
+                for key, method in methods.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
+
     def create_daily_chart(self, df: pd.DataFrame) -> Tuple[str, pd.Series]:
         """Create visualization of daily statistics."""
         try:
@@ -478,13 +1005,13 @@ class ChartGenerator:
             
             # Setup plot
             logger.debug("Setting up plot")
-            self._setup_plot()
+            ax = self._setup_plot()
             
-            # Create the main axis
-            ax = plt.gca()
+            # Long backfills keep the full daily line but thin out the markers
+            markevery = max(1, -(-len(df) // MAX_DAILY_MARKERS))
             
             # Plot data with enhanced styling
-            regular_line = plt.plot(df['date'], df['regular_tickets'],
+            regular_line = ax.plot(df['date'], df['regular_tickets'],
                     label='Regular Tickets',
                     color=self.colors['regular'],
                     linewidth=2.5,
@@ -492,9 +1019,10 @@ class ChartGenerator:
                     markersize=6,
                     markerfacecolor='white',
                     markeredgewidth=1.5,
-                    markeredgecolor=self.colors['regular'])
+                    markeredgecolor=self.colors['regular'],
+                    markevery=markevery)
             
-            emergency_line = plt.plot(df['date'], df['emergency_tickets'],
+            emergency_line = ax.plot(df['date'], df['emergency_tickets'],
                     label='Emergency Tickets',
                     color=self.colors['emergency'],
                     linewidth=2.5,
@@ -502,7 +1030,8 @@ class ChartGenerator:
                     markersize=6,
                     markerfacecolor='white',
                     markeredgewidth=1.5,
-                    markeredgecolor=self.colors['emergency'])
+                    markeredgecolor=self.colors['emergency'],
+                    markevery=markevery)
             
             # Add subtle fill below the lines
             ax.fill_between(df['date'], df['regular_tickets'], alpha=0.1, color=self.colors['regular'])
@@ -510,17 +1039,17 @@ class ChartGenerator:
             
             # Configure title and labels with enhanced typography
             title = self.style.get('title_format', 'Chicago 811 Dig Tickets - Last {days} Days')
-            plt.title(title.format(days=config.soda_days_to_fetch), 
+            ax.set_title(title.format(days=config.soda_days_to_fetch), 
                      pad=20, fontsize=14, fontweight='bold')
-            plt.xlabel('Date', fontsize=11, labelpad=10)
-            plt.ylabel('Number of Tickets', fontsize=11, labelpad=10)
+            ax.set_xlabel('Date', fontsize=11, labelpad=10)
+            ax.set_ylabel('Number of Tickets', fontsize=11, labelpad=10)
             
             # Enhance x-axis date formatting
             ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %d'))
             ax.xaxis.set_major_locator(mdates.AutoDateLocator())
             
             # Configure legend with enhanced styling
-            legend = plt.legend(bbox_to_anchor=(1.02, 1), 
+            legend = ax.legend(bbox_to_anchor=(1.02, 1), 
                               loc='upper left',
                               borderaxespad=0,
                               frameon=True,
@@ -530,21 +1059,24 @@ class ChartGenerator:
             
             # Add annotations for the latest values
             latest = df.iloc[-1]
-            plt.annotate(f'{int(latest["regular_tickets"])}',
-                        xy=(latest['date'], latest['regular_tickets']),
+            latest_date = latest['date']
+            regular_value = int(latest['regular_tickets'])
+            emergency_value = int(latest['emergency_tickets'])
+            ax.annotate(f'{regular_value}',
+                        xy=(latest_date, regular_value),
                         xytext=(10, 10), textcoords='offset points',
                         fontsize=9, color=self.colors['regular'],
                         bbox=dict(facecolor='white', edgecolor=self.colors['regular'], alpha=0.7))
             
-            plt.annotate(f'{int(latest["emergency_tickets"])}',
-                        xy=(latest['date'], latest['emergency_tickets']),
+            ax.annotate(f'{emergency_value}',
+                        xy=(latest_date, emergency_value),
                         xytext=(10, -15), textcoords='offset points',
                         fontsize=9, color=self.colors['emergency'],
                         bbox=dict(facecolor='white', edgecolor=self.colors['emergency'], alpha=0.7))
             
             # Configure layout
-            plt.xticks(rotation=30)
-            plt.tight_layout()
+            ax.tick_params(axis='x', labelrotation=30)
+            self._fig.tight_layout()
             
             # Add subtle border
             for spine in ax.spines.values():
@@ -554,15 +1086,12 @@ class ChartGenerator:
             # Save chart with high quality
             chart_path = Path(config.chart_file)
             logger.info(f"Saving chart to {chart_path}")
-            plt.savefig(chart_path, bbox_inches='tight', dpi=self.style['dpi'])
-            plt.close()
+            self._fig.savefig(chart_path, bbox_inches='tight', dpi=self.style['dpi'])
             
-            # Get latest stats
-            latest_stats = df.iloc[-1]
             logger.info("Chart generation completed successfully")
-            logger.debug(f"Latest stats: {latest_stats.to_dict()}")
+            logger.debug(f"Latest stats: {latest.to_dict()}")
             
-            return str(chart_path), latest_stats
+            return str(chart_path), latest
             
         except ChartGenerationError:
             # Re-raise validation errors
@@ -572,18 +1101,21 @@ class ChartGenerator:
             error_msg = f"Failed to generate daily chart: {str(e)}"
             logger.error(error_msg)
             
-            # Ensure figure is closed on error
+            # Ensure a half-drawn chart doesn't leak into the next one
             try:
-                plt.close()
+                if self._ax is not None:
+                    self._ax.clear()
             except:
                 pass
                 
             raise ChartGenerationError(error_msg)
             
     def __del__(self):
-        """Cleanup any open matplotlib figures."""
+        """Cleanup the matplotlib figure and the Chrome driver."""
+        self.close()
         try:
-            plt.close('all')
-            logger.debug("Closed all matplotlib figures")
+            if self._fig is not None:
+                plt.close(self._fig)
+                logger.debug("Closed matplotlib figure")
         except Exception as e:
             logger.error(f"Error closing matplotlib figures: {str(e)}")
@@ -0,0 +1,51 @@
+"""Disk cache for the analytics queries used by the test scripts.
+
+The stats are computed from the parquet snapshots in the data directory, so
+results are cached on disk keyed on the newest snapshot's modification time
+and the date, letting repeat runs skip the queries entirely.
+"""
+from datetime import datetime
+from pathlib import Path
+
+import joblib
+import pytz
+
+from src.analytics.stats import StatsGenerator
+from src.config import config
+
+memory = joblib.Memory(".pytest_cache/stats", verbose=0)
+
+def _data_mtime() -> int:
+    """Modification time of the newest parquet in the data directory, or 0 if there is none."""
+    return max(
+        (p.stat().st_mtime_ns for p in Path(config.data_dir).glob('*.parquet')),
+        default=0
+    )
+
+def _today() -> str:
+    """Today's date in Chicago; the leaderboard changes with it."""
+    return datetime.now(pytz.timezone('America/Chicago')).date().isoformat()
+
+@memory.cache(ignore=['stats'])
+def _day_of_week_comparison(stats: StatsGenerator, data_mtime: int, date_str: str) -> dict:
+    return stats.get_day_of_week_comparison(date_str)
+
+@memory.cache(ignore=['stats'])
+def _contractor_leaderboard(stats: StatsGenerator, data_mtime: int, today: str, limit: int) -> list:
+    return stats.get_contractor_leaderboard(limit=limit)
+
+@memory.cache(ignore=['stats'])
+def _daily_stats(stats: StatsGenerator, data_mtime: int, today: str) -> dict:
+    return stats.generate_daily_stats()
+
+def cached_day_of_week_comparison(stats: StatsGenerator, date_str: str) -> dict:
+    """Cached StatsGenerator.get_day_of_week_comparison."""
+    return _day_of_week_comparison(stats, _data_mtime(), date_str)
+
+def cached_contractor_leaderboard(stats: StatsGenerator, limit: int = 5) -> list:
+    """Cached StatsGenerator.get_contractor_leaderboard."""
+    return _contractor_leaderboard(stats, _data_mtime(), _today(), limit)
+
+def cached_daily_stats(stats: StatsGenerator) -> dict:
+    """Cached StatsGenerator.generate_daily_stats."""
+    return _daily_stats(stats, _data_mtime(), _today())
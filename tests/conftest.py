@@ -0,0 +1,85 @@
+"""Shared pytest fixtures for the test suite."""
+import sys
+import functools
+import logging
+from pathlib import Path
+from typing import Optional
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from src.analytics.stats import StatsGenerator
+from src.social.bluesky import BlueskyPoster
+from src.visualization.charts import ChartGenerator, HEATMAP_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=1)
+def _latest_parquet() -> Optional[Path]:
+    """Newest chicago811_*.parquet snapshot in data/, or None if there is none."""
+    return max(Path('data').glob('chicago811_*.parquet'), key=lambda p: p.stat().st_mtime, default=None)
+
+@pytest.fixture(scope="session")
+def parquet_file() -> Path:
+    """Path of the newest local parquet snapshot; skips the test when there is none."""
+    path = _latest_parquet()
+    if path is None:
+        pytest.skip("No chicago811_*.parquet snapshot in data/")
+    return path
+
+@pytest.fixture(scope="session")
+def chicago_df(parquet_file) -> pd.DataFrame:
+    """Recent permits from the local parquet snapshot, loaded once per session.
+
+    Only the columns and rows the heatmaps use are decoded.
+    """
+    logger.info("=== Loading existing data ===")
+    parquet = pq.ParquetFile(parquet_file)
+    # Record count comes from the parquet footer, without decoding any data
+    num_records = parquet.metadata.num_rows
+
+    # The heatmap only plots yesterday's permits. Filtering on dig_date in the
+    # reader skips row groups whose min/max statistics are all older than the
+    # cutoff, and only the columns the heatmap uses are decoded
+    cutoff = pd.Timestamp.now(tz='America/Chicago').normalize() - pd.Timedelta(days=2)
+    dig_date_type = parquet.schema_arrow.field('dig_date').type
+    if pa.types.is_string(dig_date_type) or pa.types.is_large_string(dig_date_type):
+        # DataStorage writes local times as '%Y-%m-%d %H:%M:%S' text, which
+        # sorts chronologically, so compare against the cutoff in that format
+        cutoff = cutoff.strftime('%Y-%m-%d %H:%M:%S')
+    elif dig_date_type.tz is None:
+        cutoff = cutoff.tz_localize(None)
+    df = pd.read_parquet(
+        parquet_file,
+        columns=HEATMAP_COLUMNS,
+        filters=[('dig_date', '>=', cutoff)]
+    )
+    # Hand the heatmap a datetime64 column even when the snapshot stores text
+    df['dig_date'] = pd.to_datetime(df['dig_date'])
+    logger.info("Loaded %d of %d records from %s", len(df), num_records, parquet_file)
+    return df
+
+@pytest.fixture(scope="session")
+def stats_gen():
+    """StatsGenerator shared by every test in the session."""
+    return StatsGenerator()
+
+@pytest.fixture(scope="session")
+def charts_gen():
+    """ChartGenerator shared by every test in the session; its browser is closed at the end."""
+    generator = ChartGenerator()
+    yield generator
+    generator.close()
+
+@pytest.fixture(scope="session")
+def poster():
+    """BlueskyPoster shared by every test in the session, always in test mode.
+
+    TEST_MODE stays set for the whole session because BlueskyPoster checks it
+    on every post as well as at construction, so tests never publish for real.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('TEST_MODE', 'true')
+        yield BlueskyPoster()
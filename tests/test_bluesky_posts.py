@@ -1,39 +1,69 @@
 """Test script to show what Bluesky posts would look like in test mode using real data."""
-from src.social.bluesky import BlueskyPoster
-from src.data.storage import DataStorage
-from src.analytics.stats import StatsGenerator
-from src.visualization.charts import ChartGenerator
-from datetime import datetime, timedelta
+from src.config import config
+from tests._cache import (
+    cached_day_of_week_comparison,
+    cached_contractor_leaderboard,
+    cached_daily_stats
+)
+from datetime import date, timedelta
 import logging
 from pathlib import Path
 import pandas as pd
+import pytest
 
 # Configure logging to print to stdout
 logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
 
-def main():
-    # Initialize components
-    storage = DataStorage()
-    stats = StatsGenerator()
-    charts = ChartGenerator()
-    poster = BlueskyPoster()
+# Leaderboard emoji by rank: medals for the top three, applause for the rest
+_EMOJI = ("🥇", "🥈", "🥉") + ("👏",) * 97
 
-    # Load existing data from parquet
-    print("\n=== Loading existing data ===")
-    parquet_file = list(Path('data').glob('chicago811_*.parquet'))[0]
-    df = pd.read_parquet(parquet_file)
-    print(f"Loaded {len(df)} records from {parquet_file}")
+def _leader_lines(leaders: list) -> str:
+    """Format leaderboard entries as one "<emoji> <name>: <count>" line each."""
+    return "".join(
+        f"{_EMOJI[i]} {leader['name']}: {leader['count']}\n"
+        for i, leader in enumerate(leaders)
+    )
+
+def _diff_phrase(value: float) -> str:
+    """Format a percentage change as an arrow and its size, e.g. "⬆️12.5%"."""
+    return f"⬆️{value}%" if value > 0 else f"⬇️{abs(value)}%"
+
+def _is_current(output_path: Path, source_path: Path) -> bool:
+    """Whether output_path was written today, after source_path last changed.
+
+    Charts show yesterday's permits, so one rendered on an earlier day is stale
+    even when the snapshot hasn't changed since.
+    """
+    if not output_path.exists():
+        return False
+    mtime = output_path.stat().st_mtime
+    return mtime >= source_path.stat().st_mtime and date.fromtimestamp(mtime) == date.today()
+
+def _daily_counts(df: pd.DataFrame) -> pd.DataFrame:
+    """Count regular and emergency permits per calendar day, in create_daily_chart's format."""
+    days = df['dig_date'].dt.normalize()
+    is_emergency = df['is_emergency'].fillna(False).astype(bool)
+    return pd.DataFrame({
+        'regular_tickets': (~is_emergency).groupby(days).sum(),
+        'emergency_tickets': is_emergency.groupby(days).sum()
+    }).rename_axis('date').reset_index()
+
+def test_thread_posts(parquet_file, chicago_df, stats_gen, charts_gen, poster):
+    """Build and simulate the daily thread and legacy posts from real data."""
+    charts = charts_gen
+    df = chicago_df
 
     # Generate day-of-week comparison
-    print("\n=== Generating day-of-week comparison ===")
+    logger.info("=== Generating day-of-week comparison ===")
     # Use yesterday's date since today's data might not be complete
-    yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-    day_comparison = stats.get_day_of_week_comparison(yesterday)
-    print(f"Day of week comparison: {day_comparison}")
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+    day_comparison = cached_day_of_week_comparison(stats_gen, yesterday)
+    logger.info("Day of week comparison: %s", day_comparison)
 
     # If no comparison data available, use sample data for testing
     if not day_comparison:
-        print("Using sample data for testing since no comparison data available")
+        logger.info("Using sample data for testing since no comparison data available")
         day_comparison = {
             'day_name': 'Friday',
             'actual_total': 100,
@@ -48,71 +78,65 @@ def main():
         }
 
     # Get contractor leaderboard
-    print("\n=== Generating contractor leaderboard ===")
-    leaderboard = stats.get_contractor_leaderboard(limit=5)
-    print(f"Top contractor: {leaderboard['overall'][0]}")
+    logger.info("=== Generating contractor leaderboard ===")
+    leaderboard = cached_contractor_leaderboard(stats_gen, limit=5)
+    logger.info("Top contractors: %s", leaderboard)
 
     # Calculate permit stats
-    print("\n=== Calculating permit statistics ===")
+    logger.info("=== Calculating permit statistics ===")
     permit_stats = {
         'total_count': day_comparison['actual_total'],
         'emergency_count': day_comparison['actual_emergency'],
         'regular_count': day_comparison['actual_total'] - day_comparison['actual_emergency'],
         'emergency_percent': round((day_comparison['actual_emergency'] / day_comparison['actual_total']) * 100, 1)
     }
-    print(f"Permit stats: {permit_stats}")
+    logger.info("Permit stats: %s", permit_stats)
 
     # Create heatmaps
-    print("\n=== Generating heatmaps ===")
+    logger.info("=== Generating heatmaps ===")
     output_dir = Path('output')
     output_dir.mkdir(exist_ok=True)
     
+    # Reuse a heatmap rendered today since the snapshot last changed
     emergency_heatmap_path = str(output_dir / 'test_emergency_heatmap.png')
-    charts.create_emergency_heatmap(df, emergency_heatmap_path)
-    print(f"Created emergency heatmap at {emergency_heatmap_path}")
+    if _is_current(Path(emergency_heatmap_path), parquet_file):
+        logger.info("Reusing emergency heatmap at %s", emergency_heatmap_path)
+    else:
+        charts.create_emergency_heatmap(df, emergency_heatmap_path)
+        logger.info("Created emergency heatmap at %s", emergency_heatmap_path)
 
-    print("\n=== Testing Thread Post with Real Data ===")
+    logger.info("=== Testing Thread Post with Real Data ===")
     
     # Format thread posts
     thread_posts = []
     
+    # Changes vs the day-of-week average, shared by the summary and permit posts
+    day_name = day_comparison['day_name']
+    total_phrase = _diff_phrase(day_comparison['total_diff_percent'])
+    emergency_phrase = _diff_phrase(day_comparison['emergency_diff_percent'])
+    regular_phrase = _diff_phrase(day_comparison['regular_diff_percent'])
+    
     # 1. Summary post comparing to historical day-of-week average
-    summary_text = f"📊 Chicago Dig Report - {day_comparison['day_name']}\n\n"
-    summary_text += f"Total Permits: {day_comparison['actual_total']} "
-    if day_comparison['total_diff_percent'] > 0:
-        summary_text += f"(⬆️ {day_comparison['total_diff_percent']}% vs avg)"
-    else:
-        summary_text += f"(⬇️ {abs(day_comparison['total_diff_percent'])}% vs avg)"
-    summary_text += f"\n\nEmergency Permits: {day_comparison['actual_emergency']} "
-    if day_comparison['emergency_diff_percent'] > 0:
-        summary_text += f"(⬆️ {day_comparison['emergency_diff_percent']}% vs avg)"
-    else:
-        summary_text += f"(⬇️ {abs(day_comparison['emergency_diff_percent'])}% vs avg)"
+    summary_text = "".join([
+        f"📊 Chicago Dig Report - {day_name}\n\n",
+        f"Total Permits: {day_comparison['actual_total']} ({total_phrase} vs avg)",
+        f"\n\nEmergency Permits: {day_comparison['actual_emergency']} ({emergency_phrase} vs avg)"
+    ])
         
     thread_posts.append({'text': summary_text})
     
     # 2. Top diggers leaderboard
-    leaders = leaderboard['overall'][:5]  # Top 5 for readability
-    leaderboard_text = "🏆 Today's Top Diggers\n\n"
-    for i, leader in enumerate(leaders, 1):
-        emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else "👏"
-        leaderboard_text += f"{emoji} {leader['name']}: {leader['count']}\n"
+    leaders = leaderboard[:5]  # Top 5 for readability
+    leaderboard_text = "🏆 Today's Top Diggers\n\n" + _leader_lines(leaders)
         
     thread_posts.append({'text': leaderboard_text})
     
     # 3. Emergency vs normal permits with heatmap
-    permit_text = f"📍 Total Permits: {permit_stats['total_count']}\n\n"
-    permit_text += f"Emergency Permits: {permit_stats['emergency_count']} "
-    if day_comparison['emergency_diff_percent'] > 0:
-        permit_text += f"⬆️{day_comparison['emergency_diff_percent']}% vs {day_comparison['day_name']} avg\n\n"
-    else:
-        permit_text += f"⬇️{abs(day_comparison['emergency_diff_percent'])}% vs {day_comparison['day_name']} avg\n\n"
-    
-    permit_text += f"Regular Permits: {permit_stats['regular_count']} "
-    if day_comparison['regular_diff_percent'] > 0:
-        permit_text += f"⬆️{day_comparison['regular_diff_percent']}% vs {day_comparison['day_name']} avg"
-    else:
-        permit_text += f"⬇️{abs(day_comparison['regular_diff_percent'])}% vs {day_comparison['day_name']} avg"
+    permit_text = "".join([
+        f"📍 Total Permits: {permit_stats['total_count']}\n\n",
+        f"Emergency Permits: {permit_stats['emergency_count']} {emergency_phrase} vs {day_name} avg\n\n",
+        f"Regular Permits: {permit_stats['regular_count']} {regular_phrase} vs {day_name} avg"
+    ])
     
     thread_posts.append({
         'text': permit_text,
@@ -121,41 +145,37 @@ def main():
     })
     
     # Post the thread
-    print("\n=== Simulating thread post ===")
+    logger.info("=== Simulating thread post ===")
     poster.post_thread(thread_posts)
 
-    print("\n=== Testing Legacy Post Formats ===")
+    logger.info("=== Testing Legacy Post Formats ===")
     
     # Now generate stats from the stored data
-    print("\n=== Generating statistics ===")
-    daily_stats = stats.generate_daily_stats()
-    chart_path, latest_stats = charts.create_daily_chart(daily_stats)
-
-    # Get records from stats
-    records = stats.get_daily_records()
-
-    print("\n=== Testing Daily Update Post with Real Data ===")
-    poster._make_post(config.bluesky_post_template.format(
-        total_tickets=latest_stats['total_tickets'],
-        emergency_tickets=latest_stats['emergency_tickets'],
-        emergency_percent=latest_stats['emergency_percent'],
-        regular_tickets=latest_stats['regular_tickets']
-    ), chart_path)
-
-    print("\n=== Testing Records Post with Real Data ===")
-    post_text = f"📊 Chicago Dig Records!\n\n"
-    post_text += f"Most dig tickets in one day: {records['most_tickets']['count']} on {records['most_tickets']['name']}\n"
-    post_text += f"Most emergency tickets: {records['most_emergency']['count']} on {records['most_emergency']['name']}"
-    poster._make_post(post_text)
-
-    print("\n=== Testing Leaderboard Post with Real Data ===")
-    leaders = leaderboard['overall']
-    post_text = "👑 Top Diggers Leaderboard\n\n"
-    for i, leader in enumerate(leaders, 1):
-        emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else "👏"
-        post_text += f"{emoji} {leader['name']}: {leader['count']}\n"
-    poster._make_post(post_text)
+    logger.info("=== Generating statistics ===")
+    daily_stats = cached_daily_stats(stats_gen)
+    chart_path = config.chart_file
+    if _is_current(Path(chart_path), parquet_file):
+        logger.info("Reusing daily chart at %s", chart_path)
+    else:
+        # chicago_df only holds the last few days, so the chart covers those
+        chart_path, _ = charts.create_daily_chart(_daily_counts(df))
+
+    logger.info("=== Testing Daily Update Post with Real Data ===")
+    total = daily_stats['total_permits']
+    emergency_percent = round(daily_stats['emergency_permits'] / total * 100, 1) if total else 0.0
+    poster.post_thread([{
+        'text': config.bluesky_post_template.format(
+            total_tickets=total,
+            emergency_tickets=daily_stats['emergency_permits'],
+            emergency_percent=emergency_percent,
+            regular_tickets=daily_stats['regular_permits']
+        ),
+        'image': chart_path
+    }])
+
+    logger.info("=== Testing Leaderboard Post with Real Data ===")
+    post_text = "👑 Top Diggers Leaderboard\n\n" + _leader_lines(leaderboard)
+    poster.post_thread([{'text': post_text}])
 
 if __name__ == "__main__":
-    from src.config import config
-    main()
+    pytest.main([__file__, "-s"])
@@ -1,8 +1,8 @@
 """Tests for the data pipeline functionality."""
 import pytest
 import pandas as pd
+import numpy as np
 from pathlib import Path
-import shutil
 from datetime import datetime, timedelta
 import json
 from src.data.fetcher import DataFetcher
@@ -60,27 +60,25 @@ class TestConfig:
         return self._db_backup_retention
 
 @pytest.fixture
-def setup_test_data(monkeypatch):
-    """Setup test data directory and cleanup after tests."""
-    # Create test data directory
-    test_data_dir = Path("test_data")
-    test_data_dir.mkdir(exist_ok=True)
+def setup_test_data(monkeypatch, tmp_path):
+    """Setup test data in a per-test temporary directory managed by pytest."""
+    test_data_dir = tmp_path
     
-    # Create test CSV data
-    test_csv = test_data_dir / "test_data.csv"
+    # Create test data as Parquet so the fetcher skips CSV parsing
+    test_parquet = test_data_dir / "test_data.parquet"
     pd.DataFrame({
         'PERMIT#': ['TEST001', 'TEST002'],
         'EMERGENCY': ['Y', 'N'],
         'REQUESTDATE': ['2024-01-01', '2024-01-02'],
         'DIGDATE': ['2024-01-02', '2024-01-03'],
-        'LATITUDE': [41.8781, 41.8782],
-        'LONGITUDE': [-87.6298, -87.6299]
-    }).to_csv(test_csv, index=False)
+        'LATITUDE': np.array([41.8781, 41.8782], dtype=np.float32),
+        'LONGITUDE': np.array([-87.6298, -87.6299], dtype=np.float32)
+    }).to_parquet(test_parquet, index=False)
     
     # Create and inject test config
     test_config = TestConfig()
     test_config.data_dir = str(test_data_dir)
-    test_config.initial_csv_path = str(test_csv)
+    test_config.initial_csv_path = str(test_parquet)
     
     # Patch the config in all modules that use it
     import src.data.fetcher
@@ -91,10 +89,17 @@ def setup_test_data(monkeypatch):
     monkeypatch.setattr(src.data.storage, 'config', test_config)
     monkeypatch.setattr(src.scripts.refresh_data, 'config', test_config)
     
-    yield test_data_dir
-    
-    # Cleanup
-    shutil.rmtree(test_data_dir)
+    return test_data_dir
+
+@pytest.fixture
+def initial_loaded(setup_test_data):
+    """Run the initial data load once for tests that build on it."""
+    clean_data_directory()
+    fetcher = DataFetcher()
+    storage = DataStorage()
+    data = fetcher.fetch_full_dataset()
+    storage.process_and_store(data)
+    return setup_test_data
 
 def test_initial_csv_load(setup_test_data):
     """Test initial data load from CSV."""
@@ -122,22 +127,19 @@ def test_initial_csv_load(setup_test_data):
     # Verify last_run_at was saved
     assert fetcher.state_file.exists()
 
-def test_incremental_api_update(setup_test_data):
+def test_incremental_api_update(initial_loaded):
     """Test incremental update via API after initial load."""
-    # First do initial load
-    test_initial_csv_load(setup_test_data)
-    
     # Mock API data by creating a new fetcher method
     original_fetch_recent = DataFetcher.fetch_recent_data
     try:
         def mock_fetch_recent(self, days=None):
             return pd.DataFrame({
-                'dig_ticket_': ['TEST003', 'TEST004'],
-                'emergency': [True, False],
-                'requestdate': ['2024-01-03', '2024-01-04'],
-                'digdate': ['2024-01-04', '2024-01-05'],
-                'latitude': [41.8783, 41.8784],
-                'longitude': [-87.6300, -87.6301]
+                'dig_ticket_': np.array(['TEST003', 'TEST004'], dtype=object),
+                'emergency': np.array([True, False], dtype=bool),
+                'requestdate': np.array(['2024-01-03', '2024-01-04'], dtype='datetime64[D]'),
+                'digdate': np.array(['2024-01-04', '2024-01-05'], dtype='datetime64[D]'),
+                'latitude': np.array([41.8783, 41.8784], dtype=np.float32),
+                'longitude': np.array([-87.6300, -87.6301], dtype=np.float32)
             })
         
         DataFetcher.fetch_recent_data = mock_fetch_recent
@@ -160,11 +162,8 @@ def test_incremental_api_update(setup_test_data):
         # Restore original method
         DataFetcher.fetch_recent_data = original_fetch_recent
 
-def test_full_refresh(setup_test_data):
+def test_full_refresh(initial_loaded):
     """Test full refresh after cleaning data directory."""
-    # First do initial load
-    test_initial_csv_load(setup_test_data)
-    
     # Clean data directory
     clean_data_directory()
     
@@ -173,12 +172,12 @@ def test_full_refresh(setup_test_data):
     try:
         def mock_fetch_recent(self, days=None):
             return pd.DataFrame({
-                'dig_ticket_': ['TEST005', 'TEST006'],
-                'emergency': [True, False],
-                'requestdate': ['2024-01-05', '2024-01-06'],
-                'digdate': ['2024-01-06', '2024-01-07'],
-                'latitude': [41.8785, 41.8786],
-                'longitude': [-87.6302, -87.6303]
+                'dig_ticket_': np.array(['TEST005', 'TEST006'], dtype=object),
+                'emergency': np.array([True, False], dtype=bool),
+                'requestdate': np.array(['2024-01-05', '2024-01-06'], dtype='datetime64[D]'),
+                'digdate': np.array(['2024-01-06', '2024-01-07'], dtype='datetime64[D]'),
+                'latitude': np.array([41.8785, 41.8786], dtype=np.float32),
+                'longitude': np.array([-87.6302, -87.6303], dtype=np.float32)
             })
         
         DataFetcher.fetch_recent_data = mock_fetch_recent
@@ -198,7 +197,7 @@ def test_full_refresh(setup_test_data):
         assert stats['updates'] == 0
         
         # Verify only one parquet file exists
-        parquet_files = list(Path(setup_test_data).glob("chicago811_*.parquet"))
+        parquet_files = list(Path(initial_loaded).glob("chicago811_*.parquet"))
         assert len(parquet_files) == 1
         
     finally:
@@ -5,8 +5,27 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 import pytest
 import pandas as pd
+import numpy as np
+from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from src.visualization.charts import ChartGenerator
+import src.visualization.charts as charts
+from src.visualization.charts import ChartGenerator, ChartGenerationError
+
+def _yesterday_df() -> pd.DataFrame:
+    """Two valid permits from yesterday (Chicago time) and one from two days ago."""
+    yesterday = pd.Timestamp.now(tz='America/Chicago').normalize().tz_localize(None) - pd.Timedelta(hours=12)
+    return pd.DataFrame({
+        'latitude': [41.88, 41.79, 41.90],
+        'longitude': [-87.63, -87.70, -87.65],
+        'dig_date': [yesterday, yesterday, yesterday - pd.Timedelta(days=1)],
+        'is_emergency': [True, False, False]
+    })
+
+@pytest.fixture
+def in_process_workers(monkeypatch):
+    """Run generate_all_heatmaps' workers on threads so patched create methods apply."""
+    monkeypatch.setattr(charts, 'ProcessPoolExecutor', ThreadPoolExecutor)
 
 def test_heatmap_with_recent_data():
     """Test heatmap generation with recent dig dates."""
@@ -16,13 +35,13 @@ def test_heatmap_with_recent_data():
     two_days_ago = today - timedelta(days=2)
     
     df = pd.DataFrame({
-        'latitude': [41.8781, 41.8782, 41.8783],
-        'longitude': [-87.6298, -87.6299, -87.6300],
-        'dig_date': [
+        'latitude': np.array([41.8781, 41.8782, 41.8783], dtype=np.float32),
+        'longitude': np.array([-87.6298, -87.6299, -87.6300], dtype=np.float32),
+        'dig_date': pd.to_datetime([
             yesterday,  # Should be included
             two_days_ago,  # Should be excluded
             today  # Should be included
-        ],
+        ]),
         'is_emergency': [True, False, False]
     })
     
@@ -40,5 +59,83 @@ def test_heatmap_with_recent_data():
     # Verify file was created
     assert Path(emergency_output).exists()
 
+def test_find_best_quality_matches_linear_search():
+    """Binary quality search should pick the same quality as stepping down from 95."""
+    rng = np.random.default_rng(0)
+    img = Image.fromarray((rng.random((300, 300, 3)) * 255).astype('uint8'))
+    
+    generator = ChartGenerator()
+    sizes = {q: len(generator._encode_jpeg(img, q)) for q in range(60, 96, 5)}
+    
+    for limit in sorted(sizes.values()) + [min(sizes.values()) - 1]:
+        generator.max_image_size = limit
+        expected = next((q for q in range(95, 59, -5) if sizes[q] <= limit), None)
+        result = generator._find_best_quality(img)
+        assert (result[0] if result else None) == expected
+
+def test_bin_locations_merges_points_per_cell():
+    """Points in the same grid cell merge into one weighted point with a rounded position."""
+    lat = np.array([41.85001, 41.85004, 41.85049])
+    lon = np.array([-87.65001, -87.64999, -87.70001])
+    
+    assert ChartGenerator._bin_locations(lat, lon) == [
+        [41.85, -87.65, 2.0],
+        [41.8505, -87.7, 1.0]
+    ]
+
+def test_bin_locations_rounds_coordinates():
+    """Cell positions carry at most HEATMAP_COORD_DECIMALS decimals and counts sum to the input."""
+    rng = np.random.default_rng(0)
+    lat = rng.uniform(41.6, 42.0, 1000)
+    lon = rng.uniform(-87.9, -87.5, 1000)
+    cells = ChartGenerator._bin_locations(lat, lon)
+    
+    assert sum(count for _, _, count in cells) == len(lat)
+    for cell_lat, cell_lon, _ in cells:
+        assert len(repr(cell_lat).split('.')[1]) <= charts.HEATMAP_COORD_DECIMALS
+        assert len(repr(cell_lon).split('.')[1]) <= charts.HEATMAP_COORD_DECIMALS
+
+def test_bin_locations_empty():
+    """No points give no heatmap points."""
+    assert ChartGenerator._bin_locations(np.array([]), np.array([])) == []
+
+def test_density_grid_is_normalized_north_up():
+    """The grid is scaled to [0, 1] and a northern cluster lands in the top rows."""
+    lat = np.full(20, 42.4)
+    lon = np.full(20, -87.5)
+    grid = ChartGenerator._density_grid(lat, lon)
+    
+    assert grid.shape == (charts.DENSITY_GRID_SIZE, charts.DENSITY_GRID_SIZE)
+    assert grid.min() >= 0 and grid.max() == pytest.approx(1.0)
+    row, col = np.unravel_index(grid.argmax(), grid.shape)
+    assert row < charts.DENSITY_GRID_SIZE * 0.2
+    assert col > charts.DENSITY_GRID_SIZE * 0.4
+
+def test_generate_all_heatmaps_filters_once(monkeypatch, in_process_workers):
+    """Both heatmaps are returned and the workers receive only the pre-filtered rows."""
+    calls = {}
+    def fake_create(name):
+        def create(self, df, output_path, prefiltered=False):
+            calls[name] = (len(df), prefiltered)
+            return output_path
+        return create
+    monkeypatch.setattr(ChartGenerator, 'create_heatmap', fake_create('heatmap'))
+    monkeypatch.setattr(ChartGenerator, 'create_emergency_heatmap', fake_create('emergency_heatmap'))
+    
+    paths = {'heatmap': 'regular.jpg', 'emergency_heatmap': 'emergency.jpg'}
+    assert ChartGenerator().generate_all_heatmaps(_yesterday_df(), paths) == paths
+    assert calls == {'heatmap': (2, True), 'emergency_heatmap': (2, True)}
+
+def test_generate_all_heatmaps_raises_worker_error(monkeypatch, in_process_workers):
+    """A failure in either worker surfaces as ChartGenerationError."""
+    def fail(self, df, output_path, prefiltered=False):
+        raise ChartGenerationError("render failed")
+    monkeypatch.setattr(ChartGenerator, 'create_heatmap', lambda self, df, output_path, prefiltered=False: output_path)
+    monkeypatch.setattr(ChartGenerator, 'create_emergency_heatmap', fail)
+    
+    paths = {'heatmap': 'regular.jpg', 'emergency_heatmap': 'emergency.jpg'}
+    with pytest.raises(ChartGenerationError, match="render failed"):
+        ChartGenerator().generate_all_heatmaps(_yesterday_df(), paths)
+
 if __name__ == "__main__":
     test_heatmap_with_recent_data()
@@ -3,11 +3,11 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from src.social.bluesky import BlueskyPoster
+import pytest
 import pandas as pd
 from datetime import datetime
 
-def test_daily_thread():
+def test_daily_thread(poster):
     """Test daily thread post with sample data."""
     # Create sample day comparison data
     day_comparison = {
@@ -42,9 +42,6 @@ def test_daily_thread():
         'emergency_percent': 10.0
     }
 
-    # Initialize poster in test mode
-    poster = BlueskyPoster()
-
     # Test thread post
     print("\n=== Testing Daily Thread Post ===")
     poster.post_daily_thread(
@@ -56,4 +53,4 @@ def test_daily_thread():
     )
 
 if __name__ == "__main__":
-    test_daily_thread()
+    pytest.main([__file__, "-s"])
@@ -0,0 +1,97 @@
+"""Tests for Street View property image fetching with a mocked HTTP session."""
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+import requests
+import src.utils.property_image as property_image
+from src.utils.property_image import PropertyImageBot, PropertyImageError
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+    def __init__(self, status_code=200, payload=None, chunks=(), error=None):
+        self.status_code = status_code
+        self._payload = payload
+        self._chunks = chunks
+        self._error = error
+
+    def json(self):
+        return self._payload
+
+    def iter_content(self, chunk_size=None):
+        yield from self._chunks
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+class FakeSession:
+    """Session returning OK metadata and the given image response for every request."""
+    def __init__(self, image_response=None, metadata_status='OK'):
+        self.image_response = image_response or FakeResponse(chunks=[b'jpeg'])
+        self.metadata_status = metadata_status
+        self.image_requests = 0
+
+    def get(self, url, params=None, **kwargs):
+        if url.endswith('/metadata'):
+            return FakeResponse(payload={'status': self.metadata_status})
+        self.image_requests += 1
+        return self.image_response
+
+@pytest.fixture
+def bot(monkeypatch, tmp_path):
+    """PropertyImageBot writing into a temporary directory with a fake API key."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(property_image, '_API_KEY', 'test-key')
+    return PropertyImageBot()
+
+def test_failed_read_raises_and_leaves_no_file(bot):
+    """A connection dropped mid-body raises PropertyImageError without a partial image."""
+    bot.session = FakeSession(FakeResponse(
+        chunks=[b'123'],
+        error=requests.exceptions.ChunkedEncodingError("connection dropped")
+    ))
+    with pytest.raises(PropertyImageError):
+        bot.get_street_view_image(41.88, -87.63, "123 N Main St", timestamp="20260101_000000")
+    assert list(bot.images_dir.iterdir()) == []
+
+class FakeLocation:
+    def __init__(self, latitude, longitude):
+        self.latitude = latitude
+        self.longitude = longitude
+
+def test_metadata_without_imagery_skips_image_request(bot):
+    """A metadata status other than OK fails before any image quota is spent."""
+    session = FakeSession(metadata_status='ZERO_RESULTS')
+    bot.session = session
+    with pytest.raises(PropertyImageError, match="ZERO_RESULTS"):
+        bot.get_street_view_image(41.88, -87.63, "123 N Main St")
+    assert session.image_requests == 0
+
+def test_filename_is_sanitized_and_capped(bot):
+    """Unsafe characters are stripped and long addresses are truncated."""
+    bot.session = FakeSession()
+    path = Path(bot.get_street_view_image(41.88, -87.63, "12/3 N. Main St.#4", timestamp="20260101_000000"))
+    assert path.name == "123_N_Main_St4_20260101_000000.jpg"
+    
+    path = Path(bot.get_street_view_image(41.88, -87.63, "A" * 500, timestamp="20260101_000000"))
+    assert path.name == "A" * property_image.MAX_FILENAME_ADDRESS_LENGTH + "_20260101_000000.jpg"
+
+def test_process_addresses_keeps_order_and_reports_errors(bot):
+    """Results follow input order, failures become error entries, duplicates get separate files."""
+    bot.session = FakeSession()
+    bot.geocode = lambda address: None if address == "Nowhere" else FakeLocation(41.88, -87.63)
+    
+    results = bot.process_addresses(["1 Main St", "Nowhere", "1 Main St"])
+    
+    assert [r['address'] for r in results] == ["1 Main St", "Nowhere", "1 Main St"]
+    assert [r['status'] for r in results] == ['success', 'error', 'success']
+    assert set(results[1]) == {'status', 'address', 'error'}
+    assert "Nowhere" in results[1]['error']
+    assert results[0]['image_path'] != results[2]['image_path']
+    assert all(Path(r['image_path']).read_bytes() == b'jpeg' for r in (results[0], results[2]))